@@ -1,20 +1,18 @@
-from fastapi import FastAPI
-import uvicorn
 import argparse
 import subprocess
-import mesop as me
 import os
-from TextSummarizer.routes.inferance import create_app  
-from TextSummarizer.viewers.mesop_text_to_text import TextSummarizerUI
-from TextSummarizer.viewers.gradio_view import create_gradio_interface
 from TextSummarizer.config.configuration import ConfigurationManager
-from TextSummarizer.entity import ViewersConfig
+from TextSummarizer.entity import ViewersConfig, ServingConfig
 from TextSummarizer.logging import logger
 
+# Each mode imports its own server/UI stack when it runs, so `serve` does not load
+# gradio or mesop and no mode loads torch/transformers before the model is warmed up.
+
 
 class App:
-    def __init__(self, mode, config: ViewersConfig):
+    def __init__(self, mode, config: ViewersConfig, serving_config: ServingConfig = None):
         self.config = config
+        self.serving_config = serving_config
         self.mode = mode
         logger.info(f"App initialized with mode: {self.mode} and configuration: {self.config}")
 
@@ -27,6 +25,8 @@ class App:
                 self.ui_mode()
             elif self.mode == "gradio":
                 self.gradio_ui()
+            elif self.mode == "serve":
+                self.serve_mode()
             else:
                 raise ValueError("Invalid mode selected")
         except Exception as e:
@@ -34,11 +34,21 @@ class App:
             raise
 
     def api_mode(self):
+        import uvicorn
+        from TextSummarizer.routes.inferance import create_app
+
         app = create_app()
         uvicorn.run(app, host="127.0.0.1", port=8000)
 
         logger.info("API mode setup completed.")
 
+    def serve_mode(self):
+        from TextSummarizer.components.api_serving import ApiServer
+
+        logger.info("Starting in multi-process serving mode...")
+        ApiServer(self.serving_config).run()
+        logger.info("Serving mode stopped.")
+
     def ui_mode(self):
         logger.info("Starting in UI mode...")
         try:
@@ -52,6 +62,8 @@ class App:
             raise
 
     def gradio_ui(self):
+        from TextSummarizer.viewers.gradio_view import create_gradio_interface
+
         interface = create_gradio_interface()
         interface.launch()
         
@@ -59,7 +71,7 @@ class App:
 if __name__ == "__main__":
     logger.info("Starting the main program...")
     parser = argparse.ArgumentParser(description="Run the app in API or UI mode")
-    parser.add_argument("mode", choices=["api", "mesop", "gradio"], help="Choose between API or UI mode")
+    parser.add_argument("mode", choices=["api", "serve", "mesop", "gradio"], help="Choose between API, multi-process API serving or UI mode")
     args = parser.parse_args()
     logger.info(f"Command-line arguments parsed: {args}")
 
@@ -70,7 +82,10 @@ if __name__ == "__main__":
         viewers_configs = config.get_viwers_config()
         logger.info(f"Viewers configuration retrieved: {viewers_configs}")
         
-        app = App(args.mode, viewers_configs)
+        serving_configs = config.get_serving_config()
+        logger.info(f"Serving configuration retrieved: {serving_configs}")
+
+        app = App(args.mode, viewers_configs, serving_configs)
         app.run()
         logger.info("Application ran successfully.")
     except Exception as e:
@@ -0,0 +1,115 @@
+"""Compare how fast the transformation stage can load the standardized corpus in each format.
+
+The standardized artifact is converted to an uncompressed Arrow IPC stream, Parquet and CSV
+in a temporary directory. Each copy is then loaded the way ``DataTransformation`` loads it,
+with a fresh ``datasets`` cache every time, and its text column is scanned once. If the
+stage's full CSV export exists (``export_csv: true``), it is timed as well, because that is
+what transformation parsed before the columnar artifact existed.
+
+    python benchmarks/artifact_load_benchmark.py --repeats 5
+"""
+import argparse
+import json
+import os
+import subprocess
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+
+from TextSummarizer.components.data_transofrmation import load_standardized_dataset
+from TextSummarizer.config.configuration import ConfigurationManager
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+TEXT_COLUMN = "transcript_standardized"
+
+
+def read_artifact(path: str) -> pa.Table:
+    if path.endswith(".parquet"):
+        return pq.read_table(path)
+    with pa.memory_map(path) as source:
+        return pa.ipc.open_stream(source).read_all()
+
+
+def write_copies(table: pa.Table, directory: str) -> dict:
+    paths = {
+        "arrow": os.path.join(directory, "standardized.arrow"),
+        "parquet": os.path.join(directory, "standardized.parquet"),
+        "csv": os.path.join(directory, "standardized.csv"),
+    }
+    with pa.OSFile(paths["arrow"], "wb") as sink, pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    pq.write_table(table, paths["parquet"])
+    pa_csv.write_csv(table, paths["csv"])
+    return paths
+
+
+def time_load(path: str, repeats: int) -> dict:
+    load_s, scan_s = [], []
+    for _ in range(repeats):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            start = time.perf_counter()
+            dataset = load_standardized_dataset(path, cache_dir=cache_dir)
+            loaded = time.perf_counter()
+            characters = sum(len(text or "") for text in dataset.data.column(TEXT_COLUMN).to_pylist())
+            load_s.append(loaded - start)
+            scan_s.append(time.perf_counter() - loaded)
+            del dataset
+    return {
+        "file_mb": round(os.path.getsize(path) / 2 ** 20, 2),
+        "load_s_min": round(min(load_s), 4),
+        "load_s_median": round(sorted(load_s)[len(load_s) // 2], 4),
+        "scan_s_min": round(min(scan_s), 4),
+        "characters": characters,
+    }
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "HEAD"], cwd=REPO_ROOT, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark loading the standardized corpus as Arrow, Parquet and CSV")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--output", default=None, help="JSON results file")
+    args = parser.parse_args()
+
+    output = Path(args.output or REPO_ROOT / "artifacts" / "benchmarks" / f"artifact_load_{datetime.now():%Y%m%d_%H%M%S}.json").resolve()
+    output.parent.mkdir(parents=True, exist_ok=True)
+    # The configuration paths are relative to the repository root
+    os.chdir(REPO_ROOT)
+
+    config = ConfigurationManager().get_data_standardization_config()
+    artifact_path = os.path.join(config.output_dir, config.artifact_file)
+    export_path = os.path.join(config.output_dir, config.output_file)
+    table = read_artifact(artifact_path)
+
+    report = {
+        "commit": git_commit(),
+        "timestamp": datetime.now().isoformat(),
+        "rows": table.num_rows,
+        "columns": table.column_names,
+        "formats": {},
+    }
+    with tempfile.TemporaryDirectory() as directory:
+        paths = write_copies(table, directory)
+        if os.path.exists(export_path):
+            paths["csv_full_export"] = export_path
+        for name, path in paths.items():
+            report["formats"][name] = time_load(path, args.repeats)
+            print(f"{name}: {json.dumps(report['formats'][name])}", flush=True)
+
+    with open(output, "w") as f:
+        json.dump(report, f, indent=4)
+    print(f"Results written to {output}")
+
+
+if __name__ == "__main__":
+    main()
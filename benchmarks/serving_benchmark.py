@@ -0,0 +1,295 @@
+"""Load-test the summarizer API and sweep batch size, beam count and worker count.
+
+Every sweep point starts ``app.py serve`` in a scratch directory with a generated
+``params.yaml``/``config.yaml``, fires synthetic TED-length documents at the predict
+route with a fixed concurrency and records latency percentiles and throughput.
+With ``--short-words`` a share of the requests are short interactive inputs mixed into
+the transcript traffic, and latency is also reported per class. This shows whether
+interactive p99 stays flat under bulk load. Results are written as JSON so runs can be
+compared between commits.
+
+    python benchmarks/serving_benchmark.py --model random --batch-sizes 1 8 --beams 1 4 --workers 1 2
+    python benchmarks/serving_benchmark.py --model random --short-words 25 --short-fraction 0.8
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import random
+import shutil
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+import httpx
+import numpy as np
+import yaml
+from transformers import AutoTokenizer
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+PREDICT_ROUTE = "/api/v1/summarizer/predict"
+READY_ROUTE = "/api/v1/summarizer/ready"
+
+WORDS = (
+    "idea world people think change story design science future city energy water "
+    "children school learn brain music art data technology health community power "
+    "question problem solution moment experience human life time work money climate "
+    "ocean planet journey discover build create share imagine believe understand"
+).split()
+
+
+def synthetic_documents(count: int, words: int, seed: int = 0):
+    """Generate TED-transcript-sized documents made of short random sentences."""
+    rng = random.Random(seed)
+    documents = []
+    for _ in range(count):
+        sentences, length = [], 0
+        while length < words:
+            sentence = [rng.choice(WORDS) for _ in range(rng.randint(6, 18))]
+            sentence[0] = sentence[0].capitalize()
+            sentences.append(" ".join(sentence) + ".")
+            length += len(sentence)
+        documents.append(" ".join(sentences))
+    return documents
+
+
+def build_random_t5(output_dir: Path, tokenizer_name: str) -> Path:
+    """Save a tiny randomly initialised T5 with the real tokenizer, for benchmarks without a trained model."""
+    import torch
+    from transformers import T5Config, T5ForConditionalGeneration
+
+    tokenizer = AutoTokenizer.from_pretrained(tokenizer_name)
+    config = T5Config(
+        vocab_size=len(tokenizer),
+        d_model=64,
+        d_kv=16,
+        d_ff=128,
+        num_layers=2,
+        num_decoder_layers=2,
+        num_heads=4,
+        pad_token_id=tokenizer.pad_token_id,
+        eos_token_id=tokenizer.eos_token_id,
+        decoder_start_token_id=tokenizer.pad_token_id,
+    )
+    torch.manual_seed(0)
+    T5ForConditionalGeneration(config).save_pretrained(output_dir)
+    tokenizer.save_pretrained(output_dir)
+    return output_dir
+
+
+def free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def write_workdir(workdir: Path, model_dir: Path, batch_size: int, beams: int, workers: int, port: int, concurrency: int):
+    """Write config/config.yaml and params.yaml for one sweep point into ``workdir``."""
+    (workdir / "config").mkdir(parents=True, exist_ok=True)
+    shutil.copy(REPO_ROOT / "config" / "config.yaml", workdir / "config" / "config.yaml")
+    with open(workdir / "config" / "config.yaml") as f:
+        config = yaml.safe_load(f)
+    config["serving"] = {
+        "host": "127.0.0.1",
+        "port": port,
+        "workers": workers,
+        "threads_per_worker": max(1, (os.cpu_count() or 1) // workers),
+        "pin_cpus": True,
+    }
+    with open(workdir / "config" / "config.yaml", "w") as f:
+        yaml.safe_dump(config, f)
+
+    with open(REPO_ROOT / "params.yaml") as f:
+        params = yaml.safe_load(f)
+    params["model"]["output_dir"] = str(model_dir.parent)
+    params["inference"].update({
+        "model_name": model_dir.name,
+        "tokenizer_name": model_dir.name,
+        "default_profile": "benchmark",
+        "max_batch_size": batch_size,
+        "max_queue_size": max(256, concurrency * 2),
+        "cache_enabled": False,
+        "cache_dir": str(workdir / "cache"),
+    })
+    params["generation_profiles"]["benchmark"] = {"num_beams": beams, "max_length": 128}
+    with open(workdir / "params.yaml", "w") as f:
+        yaml.safe_dump(params, f)
+
+
+def start_server(workdir: Path, log_file):
+    return subprocess.Popen(
+        [sys.executable, str(REPO_ROOT / "app.py"), "serve"],
+        cwd=workdir,
+        stdout=log_file,
+        stderr=subprocess.STDOUT,
+    )
+
+
+def stop_server(process: subprocess.Popen):
+    if process.poll() is None:
+        process.send_signal(signal.SIGTERM)
+        try:
+            process.wait(timeout=60)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def wait_until_ready(base_url: str, process: subprocess.Popen, workers: int, timeout: float = 900):
+    deadline = time.monotonic() + timeout
+    consecutive = 0
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Server exited with code {process.returncode} before becoming ready")
+        try:
+            response = httpx.get(base_url + READY_ROUTE, timeout=5)
+            consecutive = consecutive + 1 if response.status_code == 200 else 0
+        except httpx.HTTPError:
+            consecutive = 0
+        # Readiness is answered by whichever worker accepts; require several in a row
+        if consecutive >= 2 * workers:
+            return
+        time.sleep(0.5)
+    raise TimeoutError(f"Server was not ready after {timeout}s")
+
+
+async def run_load(base_url: str, documents, requests: int, concurrency: int, short_documents=(), short_fraction: float = 0.0):
+    latencies, summaries, inputs, errors = [], [], [], {}
+    latencies_by_class = {"short": [], "long": []}
+    counter = itertools.count()
+    rng = random.Random(1)
+
+    async def worker(client: httpx.AsyncClient):
+        while True:
+            index = next(counter)
+            if index >= requests:
+                return
+            interactive = bool(short_documents) and rng.random() < short_fraction
+            document = (short_documents if interactive else documents)[index % len(short_documents if interactive else documents)]
+            start = time.perf_counter()
+            try:
+                response = await client.post(PREDICT_ROUTE, params={"text": document})
+            except httpx.HTTPError as e:
+                errors[type(e).__name__] = errors.get(type(e).__name__, 0) + 1
+                continue
+            if response.status_code != 200:
+                errors[str(response.status_code)] = errors.get(str(response.status_code), 0) + 1
+                continue
+            latencies.append(time.perf_counter() - start)
+            latencies_by_class["short" if interactive else "long"].append(latencies[-1])
+            summaries.append(response.json()["summary"])
+            inputs.append(document)
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=600) as client:
+        start = time.perf_counter()
+        await asyncio.gather(*(worker(client) for _ in range(concurrency)))
+        wall = time.perf_counter() - start
+    return latencies, summaries, inputs, errors, wall, latencies_by_class
+
+
+def percentiles_ms(latencies) -> dict:
+    if not latencies:
+        return {"p50": None, "p95": None, "p99": None}
+    latencies_ms = np.array(latencies) * 1000
+    return {f"p{q}": round(float(np.percentile(latencies_ms, q)), 2) for q in (50, 95, 99)}
+
+
+def summarize_run(latencies, summaries, inputs, errors, wall, latencies_by_class, tokenizer, max_input_tokens: int) -> dict:
+    input_tokens = sum(min(len(ids), max_input_tokens) for ids in tokenizer(inputs)["input_ids"]) if inputs else 0
+    output_tokens = sum(len(ids) for ids in tokenizer(summaries)["input_ids"]) if summaries else 0
+    latencies_ms = np.array(latencies) * 1000
+    return {
+        "completed": len(latencies),
+        "errors": errors,
+        "wall_s": round(wall, 3),
+        "requests_per_s": round(len(latencies) / wall, 3) if wall else 0.0,
+        "input_tokens_per_s": round(input_tokens / wall, 1) if wall else 0.0,
+        "output_tokens_per_s": round(output_tokens / wall, 1) if wall else 0.0,
+        "latency_ms_p50": round(float(np.percentile(latencies_ms, 50)), 2) if len(latencies_ms) else None,
+        "latency_ms_p95": round(float(np.percentile(latencies_ms, 95)), 2) if len(latencies_ms) else None,
+        "latency_ms_p99": round(float(np.percentile(latencies_ms, 99)), 2) if len(latencies_ms) else None,
+        "latency_ms_mean": round(float(latencies_ms.mean()), 2) if len(latencies_ms) else None,
+        "latency_ms_by_class": {name: percentiles_ms(values) for name, values in latencies_by_class.items() if values},
+    }
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "HEAD"], cwd=REPO_ROOT, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark summarizer serving throughput and latency")
+    parser.add_argument("--model", default="random", help="'random' for a tiny random T5, or a saved model directory")
+    parser.add_argument("--tokenizer", default="google-t5/t5-small", help="Tokenizer used for the random model")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=128)
+    parser.add_argument("--words", type=int, default=1500, help="Words per synthetic document")
+    parser.add_argument("--documents", type=int, default=64, help="Distinct synthetic documents")
+    parser.add_argument("--short-words", type=int, default=0, help="Mix in interactive documents of this many words (0 disables)")
+    parser.add_argument("--short-fraction", type=float, default=0.5, help="Share of requests that are interactive when mixing")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 8])
+    parser.add_argument("--beams", type=int, nargs="+", default=[1, 4])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1])
+    parser.add_argument("--output", default=None, help="JSON results file")
+    args = parser.parse_args()
+
+    scratch = Path(tempfile.mkdtemp(prefix="summarizer-bench-"))
+    try:
+        if args.model == "random":
+            model_dir = build_random_t5(scratch / "random_t5", args.tokenizer)
+        else:
+            model_dir = Path(args.model).resolve()
+        tokenizer = AutoTokenizer.from_pretrained(model_dir)
+        documents = synthetic_documents(args.documents, args.words)
+        short_documents = synthetic_documents(args.documents, args.short_words, seed=1) if args.short_words else []
+
+        results = []
+        for batch_size, beams, workers in itertools.product(args.batch_sizes, args.beams, args.workers):
+            point = {"batch_size": batch_size, "beams": beams, "workers": workers}
+            print(f"Running sweep point {point}", flush=True)
+            workdir = scratch / f"bs{batch_size}_beams{beams}_workers{workers}"
+            port = free_port()
+            write_workdir(workdir, model_dir, batch_size, beams, workers, port, args.concurrency)
+            base_url = f"http://127.0.0.1:{port}"
+            with open(workdir / "server.log", "w") as log_file:
+                process = start_server(workdir, log_file)
+                try:
+                    wait_until_ready(base_url, process, workers)
+                    asyncio.run(run_load(base_url, documents, args.concurrency, args.concurrency))
+                    run = asyncio.run(run_load(base_url, documents, args.requests, args.concurrency, short_documents, args.short_fraction))
+                finally:
+                    stop_server(process)
+            point.update(summarize_run(*run, tokenizer, tokenizer.model_max_length))
+            print(json.dumps(point), flush=True)
+            results.append(point)
+
+        report = {
+            "commit": git_commit(),
+            "timestamp": datetime.now().isoformat(),
+            "model": args.model,
+            "concurrency": args.concurrency,
+            "requests": args.requests,
+            "words_per_document": args.words,
+            "short_words_per_document": args.short_words,
+            "short_fraction": args.short_fraction if args.short_words else 0.0,
+            "results": results,
+        }
+        output = Path(args.output or REPO_ROOT / "artifacts" / "benchmarks" / f"serving_{datetime.now():%Y%m%d_%H%M%S}.json")
+        output.parent.mkdir(parents=True, exist_ok=True)
+        with open(output, "w") as f:
+            json.dump(report, f, indent=4)
+        print(f"Results written to {output}")
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""Measure the throughput of the data standardization stage on the TED corpus.
+
+The corpus is loaded and merged the same way the pipeline does it. Then every configured
+text column is cleaned with the row-by-row ``clean_text`` and with the vectorized
+``clean_series``. The script checks that both produce identical strings and reports the
+rows/sec of each. Stopword removal and lemmatization are timed three ways: rebuilding the
+stopword set and lemmatizer per cell as the stage used to, with a cold lemma memo, and with
+a memo reloaded from disk. With ``--workers`` the stopword/lemma step is also run on a
+process pool of each size, with a cold lemma memo, to show how it scales with cores.
+
+    python benchmarks/standardization_benchmark.py --repeats 3 --workers 1 2 4 8 16 32
+"""
+import argparse
+import dataclasses
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+from TextSummarizer.components.data_standerization import DataStandardization, LemmaMemo, clean_series
+from TextSummarizer.config.configuration import ConfigurationManager
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def best_of(repeats: int, fn):
+    timings, result = [], None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def rowwise_clean(standardizer: DataStandardization, df: pd.DataFrame) -> dict:
+    return {column: df[column].apply(standardizer.clean_text) for column in standardizer.text_columns}
+
+
+def vectorized_clean(standardizer: DataStandardization, df: pd.DataFrame) -> dict:
+    cleaned = clean_series(pd.concat([df[column] for column in standardizer.text_columns], ignore_index=True))
+    return {
+        column: cleaned.iloc[position * len(df):(position + 1) * len(df)].set_axis(df.index)
+        for position, column in enumerate(standardizer.text_columns)
+    }
+
+
+def per_cell_standardize(text: str) -> str:
+    """Stopword removal and lemmatization as they ran before the stopwords and lemmas were cached."""
+    from nltk.corpus import stopwords
+    from nltk.stem import WordNetLemmatizer
+
+    stop_words = set(stopwords.words("english"))
+    words = [word for word in text.split() if word not in stop_words]
+    lemmatizer = WordNetLemmatizer()
+    return " ".join(lemmatizer.lemmatize(word) for word in words)
+
+
+def standardize_cleaned(standardizer: DataStandardization, cleaned: dict, fn=None) -> dict:
+    fn = fn or standardizer.standardize_cleaned_text
+    return {column: values.map(fn) for column, values in cleaned.items()}
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "HEAD"], cwd=REPO_ROOT, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the standardization stage on the TED corpus")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--rows", type=int, default=None, help="Only use the first N merged rows")
+    parser.add_argument("--workers", type=int, nargs="*", default=[], help="Process pool sizes to sweep")
+    parser.add_argument("--chunk-size", type=int, default=None, help="Cells per pool task (default: config.yaml)")
+    parser.add_argument("--output", default=None, help="JSON results file")
+    args = parser.parse_args()
+
+    output = Path(args.output or REPO_ROOT / "artifacts" / "benchmarks" / f"standardization_{datetime.now():%Y%m%d_%H%M%S}.json")
+    output = output.resolve()
+    output.parent.mkdir(parents=True, exist_ok=True)
+    # The configuration paths are relative to the repository root
+    os.chdir(REPO_ROOT)
+
+    standardizer = DataStandardization(ConfigurationManager().get_data_standardization_config())
+    df = standardizer.load_and_prepare_data()
+    if args.rows:
+        df = df.head(args.rows)
+    rows = len(df)
+
+    report = {
+        "commit": git_commit(),
+        "timestamp": datetime.now().isoformat(),
+        "rows": rows,
+        "text_columns": list(standardizer.text_columns),
+        "clean": {},
+    }
+
+    rowwise_s, expected = best_of(args.repeats, lambda: rowwise_clean(standardizer, df))
+    vectorized_s, actual = best_of(args.repeats, lambda: vectorized_clean(standardizer, df))
+    identical = all(expected[column].equals(actual[column]) for column in standardizer.text_columns)
+    report["clean"] = {
+        "rowwise_rows_per_s": round(rows / rowwise_s, 1),
+        "vectorized_rows_per_s": round(rows / vectorized_s, 1),
+        "speedup": round(rowwise_s / vectorized_s, 2),
+        "identical": identical,
+    }
+    print(f"clean: {json.dumps(report['clean'])}", flush=True)
+
+    per_cell_s, expected = best_of(1, lambda: standardize_cleaned(standardizer, actual, per_cell_standardize))
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        lemma_file = os.path.join(tmp_dir, "lemmas.json")
+        standardizer.lemmas = LemmaMemo(lemma_file, standardizer.config.lemma_cache_size)
+        cold_s, memoized = best_of(1, lambda: standardize_cleaned(standardizer, actual))
+        standardizer.lemmas.save()
+        standardizer.lemmas = LemmaMemo(lemma_file, standardizer.config.lemma_cache_size)
+        warm_s, _ = best_of(args.repeats, lambda: standardize_cleaned(standardizer, actual))
+        report["standardize"] = {
+            "per_cell_rows_per_s": round(rows / per_cell_s, 1),
+            "cold_memo_rows_per_s": round(rows / cold_s, 1),
+            "warm_memo_rows_per_s": round(rows / warm_s, 1),
+            "distinct_words": len(standardizer.lemmas.table),
+            "wordnet_loaded_on_warm_run": standardizer.lemmas._lemmatizer is not None,
+            "identical": all(expected[column].equals(memoized[column]) for column in expected),
+        }
+    identical = identical and report["standardize"]["identical"]
+    print(f"standardize: {json.dumps(report['standardize'])}", flush=True)
+
+    if args.workers:
+        scaling_config = dataclasses.replace(standardizer.config, lemma_cache_file=None, chunk_size=args.chunk_size or standardizer.config.chunk_size)
+        cells = pd.concat(list(actual.values()), ignore_index=True)
+        report["scaling"] = {"cpu_count": os.cpu_count(), "chunk_size": scaling_config.chunk_size, "runs": []}
+        single_s, reference = None, None
+        for workers in args.workers:
+            scaled = DataStandardization(dataclasses.replace(scaling_config, workers=workers), download_models=False)
+            elapsed, result = best_of(1, lambda: scaled.standardize_cleaned_series(cells))
+            if single_s is None:
+                single_s, reference = elapsed, result
+            run = {
+                "workers": workers,
+                "rows_per_s": round(rows / elapsed, 1),
+                "speedup": round(single_s / elapsed, 2),
+                "identical": result.equals(reference),
+            }
+            identical = identical and run["identical"]
+            report["scaling"]["runs"].append(run)
+            print(f"scaling: {json.dumps(run)}", flush=True)
+
+    with open(output, "w") as f:
+        json.dump(report, f, indent=4)
+    print(f"Results written to {output}")
+    if not identical:
+        sys.exit("Optimized standardization does not match the row-by-row path")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""Measure how long each ``app.py`` mode takes to start listening.
+
+For every mode the app is launched from the repository root and timed until its port
+accepts TCP connections (time-to-listening) and, for the API modes, until the readiness
+route reports a warmed model. The cost of importing ``app`` itself and the heavy libraries
+it pulls in are recorded too, so import regressions show up between commits.
+
+    python benchmarks/startup_benchmark.py --modes api serve gradio --repeats 3
+"""
+import argparse
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from datetime import datetime
+from pathlib import Path
+
+import yaml
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+READY_ROUTE = "/api/v1/summarizer/ready"
+HEAVY_MODULES = ("torch", "transformers", "datasets", "nltk", "pandas", "gradio", "mesop", "uvicorn", "fastapi")
+
+IMPORT_PROBE = f"""
+import json, sys, time
+start = time.perf_counter()
+import app
+print(json.dumps({{
+    "import_s": round(time.perf_counter() - start, 3),
+    "heavy_modules_loaded": [m for m in {HEAVY_MODULES!r} if m in sys.modules],
+}}))
+"""
+
+
+def mode_ports() -> dict:
+    with open(REPO_ROOT / "config" / "config.yaml") as f:
+        config = yaml.safe_load(f)
+    return {
+        "api": 8000,
+        "serve": config["serving"]["port"],
+        "gradio": int(os.environ.get("GRADIO_SERVER_PORT", 7860)),
+        "mesop": 32123,
+    }
+
+
+def measure_import() -> dict:
+    output = subprocess.check_output([sys.executable, "-c", IMPORT_PROBE], cwd=REPO_ROOT, text=True)
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def port_open(port: int) -> bool:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.settimeout(0.2)
+        return sock.connect_ex(("127.0.0.1", port)) == 0
+
+
+def is_ready(port: int) -> bool:
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}{READY_ROUTE}", timeout=5) as response:
+            return response.status == 200
+    except (urllib.error.URLError, OSError):
+        return False
+
+
+def stop(process: subprocess.Popen):
+    if process.poll() is not None:
+        return
+    # The mesop mode runs the mesop CLI as a child process, so signal the whole group
+    if os.name == "posix":
+        os.killpg(process.pid, signal.SIGTERM)
+    else:
+        process.terminate()
+    try:
+        process.wait(timeout=30)
+    except subprocess.TimeoutExpired:
+        if os.name == "posix":
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            process.kill()
+        process.wait()
+
+
+def measure_mode(mode: str, port: int, wait_ready: bool, timeout: float, log_file) -> dict:
+    if port_open(port):
+        raise RuntimeError(f"Port {port} is already in use; stop whatever is listening before benchmarking '{mode}'")
+
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "app.py", mode],
+        cwd=REPO_ROOT,
+        stdout=log_file,
+        stderr=subprocess.STDOUT,
+        start_new_session=os.name == "posix",
+    )
+    result = {"mode": mode, "port": port, "time_to_listening_s": None, "time_to_ready_s": None}
+    try:
+        deadline = start + timeout
+        while time.perf_counter() < deadline:
+            if process.poll() is not None:
+                raise RuntimeError(f"'{mode}' exited with code {process.returncode} before listening")
+            if result["time_to_listening_s"] is None and port_open(port):
+                result["time_to_listening_s"] = round(time.perf_counter() - start, 3)
+                if not wait_ready or mode not in ("api", "serve"):
+                    break
+            if result["time_to_listening_s"] is not None and is_ready(port):
+                result["time_to_ready_s"] = round(time.perf_counter() - start, 3)
+                break
+            time.sleep(0.05)
+        else:
+            raise TimeoutError(f"'{mode}' did not start within {timeout}s")
+    finally:
+        stop(process)
+    return result
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "HEAD"], cwd=REPO_ROOT, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark time-to-listening of each app mode")
+    parser.add_argument("--modes", nargs="+", default=["api", "serve", "gradio", "mesop"], choices=["api", "serve", "gradio", "mesop"])
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--wait-ready", action="store_true", help="Also time until the API reports a warmed model")
+    parser.add_argument("--timeout", type=float, default=600)
+    parser.add_argument("--output", default=None, help="JSON results file")
+    args = parser.parse_args()
+
+    output = Path(args.output or REPO_ROOT / "artifacts" / "benchmarks" / f"startup_{datetime.now():%Y%m%d_%H%M%S}.json")
+    output.parent.mkdir(parents=True, exist_ok=True)
+    ports = mode_ports()
+
+    report = {
+        "commit": git_commit(),
+        "timestamp": datetime.now().isoformat(),
+        "app_import": measure_import(),
+        "modes": {},
+    }
+    print(f"Importing app: {json.dumps(report['app_import'])}", flush=True)
+
+    with open(output.with_suffix(".log"), "w") as log_file:
+        for mode in args.modes:
+            runs = [measure_mode(mode, ports[mode], args.wait_ready, args.timeout, log_file) for _ in range(args.repeats)]
+            listening = sorted(run["time_to_listening_s"] for run in runs)
+            report["modes"][mode] = {
+                "runs": runs,
+                "time_to_listening_s_median": listening[len(listening) // 2],
+                "time_to_listening_s_min": listening[0],
+            }
+            print(f"{mode}: {json.dumps(report['modes'][mode])}", flush=True)
+
+    with open(output, "w") as f:
+        json.dump(report, f, indent=4)
+    print(f"Results written to {output}")
+
+
+if __name__ == "__main__":
+    main()
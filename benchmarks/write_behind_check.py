@@ -0,0 +1,198 @@
+"""Check the write-behind summary buffer against an in-process MongoDB (``mongomock``).
+
+Every scenario runs a ``WriteBehindBuffer`` over a mongomock collection and checks what
+ended up in it: a full batch is written without waiting for the interval, a partial batch
+is written once the interval passes, failed inserts are retried without duplicating
+documents, a full buffer drops new documents instead of growing, and ``close`` writes what
+is still buffered. It needs ``mongomock`` from requirements.txt but no database or model.
+
+    python benchmarks/write_behind_check.py
+"""
+import argparse
+import json
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+import mongomock
+from pymongo.errors import AutoReconnect, BulkWriteError
+
+from TextSummarizer.components.summary_writer import WriteBehindBuffer, summary_document
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+NOT_PRIMARY_ERROR = 10107
+
+
+class FlakyCollection:
+    """Wraps a collection so the first ``insert_many`` calls fail like a real cluster can.
+
+    ``network_failures`` calls raise before writing anything. The next ``partial_failures``
+    calls write every document but report the second half as failed, as when an
+    acknowledgement is lost, so the retry hits duplicate keys for documents already written.
+    """
+
+    def __init__(self, collection, network_failures: int = 0, partial_failures: int = 0):
+        self.collection = collection
+        self.network_failures = network_failures
+        self.partial_failures = partial_failures
+        self.calls = 0
+
+    def insert_many(self, documents, ordered: bool = True):
+        self.calls += 1
+        if self.network_failures:
+            self.network_failures -= 1
+            raise AutoReconnect("simulated connection reset")
+        result = self.collection.insert_many(documents, ordered=ordered)
+        if self.partial_failures:
+            self.partial_failures -= 1
+            errors = [{"index": index, "code": NOT_PRIMARY_ERROR, "errmsg": "simulated not primary"}
+                      for index in range(len(documents) // 2, len(documents))]
+            raise BulkWriteError({"writeErrors": errors, "nInserted": len(documents) - len(errors)})
+        return result
+
+
+class BlockingCollection:
+    """Holds every ``insert_many`` until ``release`` is set, so the buffer fills up."""
+
+    def __init__(self, collection):
+        self.collection = collection
+        self.entered = threading.Event()
+        self.release = threading.Event()
+
+    def insert_many(self, documents, ordered: bool = True):
+        self.entered.set()
+        self.release.wait()
+        return self.collection.insert_many(documents, ordered=ordered)
+
+
+def new_collection():
+    return mongomock.MongoClient().summaries.summaries
+
+
+def documents(count: int, prefix: str):
+    return [summary_document(f"{prefix} text {index}", f"{prefix} summary {index}", "check") for index in range(count)]
+
+
+def wait_for(predicate, timeout: float) -> float:
+    """Seconds until ``predicate()`` held, or ``-1`` if it did not within ``timeout``."""
+    start = time.perf_counter()
+    while time.perf_counter() - start < timeout:
+        if predicate():
+            return time.perf_counter() - start
+        time.sleep(0.005)
+    return -1.0
+
+
+def check_size_flush() -> dict:
+    collection = new_collection()
+    buffer = WriteBehindBuffer(collection, batch_size=50, flush_interval_s=60)
+    for document in documents(50, "size"):
+        buffer.put(document)
+    seconds = wait_for(lambda: collection.count_documents({}) == 50, timeout=5)
+    stats = buffer.stats()
+    buffer.close()
+    return {"passed": 0 <= seconds < 5 and stats["batches"] == 1, "seconds": round(seconds, 4), **stats}
+
+
+def check_time_flush() -> dict:
+    collection = new_collection()
+    buffer = WriteBehindBuffer(collection, batch_size=1000, flush_interval_s=0.2)
+    for document in documents(7, "time"):
+        buffer.put(document)
+    written_early = collection.count_documents({})
+    seconds = wait_for(lambda: collection.count_documents({}) == 7, timeout=5)
+    stats = buffer.stats()
+    buffer.close()
+    return {"passed": written_early == 0 and 0.1 <= seconds < 5, "written_before_interval": written_early, "seconds": round(seconds, 4), **stats}
+
+
+def check_retry() -> dict:
+    collection = new_collection()
+    flaky = FlakyCollection(collection, network_failures=2, partial_failures=1)
+    buffer = WriteBehindBuffer(flaky, batch_size=20, flush_interval_s=60, retry_backoff_s=0.01)
+    ids = [buffer.put(document) for document in documents(20, "retry")]
+    buffer.close()
+    stored = collection.count_documents({})
+    distinct = len(collection.distinct("_id"))
+    stats = buffer.stats()
+    passed = stored == 20 and distinct == len(set(ids)) == 20 and stats["written"] == 20 and stats["failed"] == 0
+    return {"passed": passed, "insert_calls": flaky.calls, "stored": stored, **stats}
+
+
+def check_bounded_buffer() -> dict:
+    collection = new_collection()
+    blocking = BlockingCollection(collection)
+    buffer = WriteBehindBuffer(blocking, batch_size=10, flush_interval_s=60, max_buffer_size=30)
+    # The first batch is taken by the flusher and blocks in insert_many; then 30 fit in the buffer
+    accepted = [buffer.put(document) for document in documents(10, "first")]
+    blocking.entered.wait(5)
+    accepted += [buffer.put(document) for document in documents(50, "overflow")]
+    kept = sum(document_id is not None for document_id in accepted)
+    blocking.release.set()
+    buffer.close()
+    stats = buffer.stats()
+    passed = kept == 40 and stats["dropped"] == 20 and collection.count_documents({}) == 40
+    return {"passed": passed, "accepted": kept, **stats}
+
+
+def check_shutdown_flush() -> dict:
+    collection = new_collection()
+    buffer = WriteBehindBuffer(collection, batch_size=1000, flush_interval_s=60)
+    for document in documents(25, "shutdown"):
+        buffer.put(document)
+    written_before_close = collection.count_documents({})
+    buffer.close()
+    try:
+        buffer.put(documents(1, "late")[0])
+        rejected_after_close = False
+    except RuntimeError:
+        rejected_after_close = True
+    stored = collection.count_documents({})
+    passed = written_before_close == 0 and stored == 25 and rejected_after_close
+    return {"passed": passed, "written_before_close": written_before_close, "stored": stored,
+            "rejected_after_close": rejected_after_close, **buffer.stats()}
+
+
+CHECKS = {
+    "size_flush": check_size_flush,
+    "time_flush": check_time_flush,
+    "retry": check_retry,
+    "bounded_buffer": check_bounded_buffer,
+    "shutdown_flush": check_shutdown_flush,
+}
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "HEAD"], cwd=REPO_ROOT, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check the write-behind summary buffer against mongomock")
+    parser.add_argument("--checks", nargs="*", choices=sorted(CHECKS), default=list(CHECKS))
+    parser.add_argument("--output", default=None, help="JSON results file")
+    args = parser.parse_args()
+
+    output = Path(args.output or REPO_ROOT / "artifacts" / "benchmarks" / f"write_behind_{datetime.now():%Y%m%d_%H%M%S}.json").resolve()
+    output.parent.mkdir(parents=True, exist_ok=True)
+
+    report = {"commit": git_commit(), "timestamp": datetime.now().isoformat(), "checks": {}}
+    for name in args.checks:
+        report["checks"][name] = CHECKS[name]()
+        print(f"{name}: {json.dumps(report['checks'][name])}", flush=True)
+
+    with open(output, "w") as f:
+        json.dump(report, f, indent=4)
+    print(f"Results written to {output}")
+    failed = [name for name, result in report["checks"].items() if not result["passed"]]
+    if failed:
+        sys.exit(f"Write-behind checks failed: {', '.join(failed)}")
+
+
+if __name__ == "__main__":
+    main()
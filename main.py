@@ -6,58 +6,60 @@ from TextSummarizer.pipeline.model_summarizer_pipeline import SummarizationModel
 from TextSummarizer.logging import logger
 
 
-STAGE_NAME = "Data Ingestion stage"
-try:
-   logger.info(f">>>>>>> stage {STAGE_NAME} started <<<<<<<") 
-   data_ingestion = DataIngestionPipeline()
-   data_ingestion.main()
-   logger.info(f">>>>>> stage {STAGE_NAME} completed <<<<<<<\n\nx==============================x")
-except Exception as e:
-        logger.exception(e)
-        raise e
+# Stages may start process pools; spawn/forkserver workers re-import this module
+if __name__ == "__main__":
+    STAGE_NAME = "Data Ingestion stage"
+    try:
+       logger.info(f">>>>>>> stage {STAGE_NAME} started <<<<<<<") 
+       data_ingestion = DataIngestionPipeline()
+       data_ingestion.main()
+       logger.info(f">>>>>> stage {STAGE_NAME} completed <<<<<<<\n\nx==============================x")
+    except Exception as e:
+            logger.exception(e)
+            raise e
  
      
-STAGE_NAME = "Data validation stage"
-try:
-   logger.info(f">>>>>>> stage {STAGE_NAME} started <<<<<<<") 
-   data_validation = DataValidationPipeline()
-   data_validation.main()
-   logger.info(f">>>>>>> stage {STAGE_NAME} completed <<<<<<<\n\nx==============================x")
-except Exception as e:
-        logger.exception(e)
-        raise e
-     
-     
-STAGE_NAME = "Data standerization stage"
-try:
-   logger.info(f">>>>>>> stage {STAGE_NAME} started <<<<<<<") 
-   data_standerization = DataStanderizationPipeline()
-   data_standerization.main()
-   logger.info(f">>>>>>> stage {STAGE_NAME} completed <<<<<<<\n\nx==============================x")
-except Exception as e:
-        logger.exception(e)
-        raise e
-     
-     
-     
-STAGE_NAME = "Data transformation stage"
-try:
-   logger.info(f">>>>>>> stage {STAGE_NAME} started <<<<<<<") 
-   data_transformation = DataTransformationPipeline()
-   data_transformation.main()
-   logger.info(f">>>>>>> stage {STAGE_NAME} completed <<<<<<<\n\nx==============================x")
-except Exception as e:
-        logger.exception(e)
-        raise e
-     
-     
-     
-STAGE_NAME = "Model Development stage"
-try:
-   logger.info(f">>>>>>> stage {STAGE_NAME} started <<<<<<<") 
-   SummarizationModel = SummarizationModelPipeline()
-   SummarizationModel.main()
-   logger.info(f">>>>>>> stage {STAGE_NAME} completed <<<<<<<\n\nx==============================x")
-except Exception as e:
-        logger.exception(e)
-        raise e
\ No newline at end of file
+    STAGE_NAME = "Data validation stage"
+    try:
+       logger.info(f">>>>>>> stage {STAGE_NAME} started <<<<<<<") 
+       data_validation = DataValidationPipeline()
+       data_validation.main()
+       logger.info(f">>>>>>> stage {STAGE_NAME} completed <<<<<<<\n\nx==============================x")
+    except Exception as e:
+            logger.exception(e)
+            raise e
+     
+     
+    STAGE_NAME = "Data standerization stage"
+    try:
+       logger.info(f">>>>>>> stage {STAGE_NAME} started <<<<<<<") 
+       data_standerization = DataStanderizationPipeline()
+       data_standerization.main()
+       logger.info(f">>>>>>> stage {STAGE_NAME} completed <<<<<<<\n\nx==============================x")
+    except Exception as e:
+            logger.exception(e)
+            raise e
+     
+     
+     
+    STAGE_NAME = "Data transformation stage"
+    try:
+       logger.info(f">>>>>>> stage {STAGE_NAME} started <<<<<<<") 
+       data_transformation = DataTransformationPipeline()
+       data_transformation.main()
+       logger.info(f">>>>>>> stage {STAGE_NAME} completed <<<<<<<\n\nx==============================x")
+    except Exception as e:
+            logger.exception(e)
+            raise e
+     
+     
+     
+    STAGE_NAME = "Model Development stage"
+    try:
+       logger.info(f">>>>>>> stage {STAGE_NAME} started <<<<<<<") 
+       SummarizationModel = SummarizationModelPipeline()
+       SummarizationModel.main()
+       logger.info(f">>>>>>> stage {STAGE_NAME} completed <<<<<<<\n\nx==============================x")
+    except Exception as e:
+            logger.exception(e)
+            raise e
\ No newline at end of file
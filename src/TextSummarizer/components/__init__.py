@@ -1,5 +1,11 @@
-from . import data_ingestion
-from . import data_standerization
-from . import data_transofrmation
-from . import data_validation
- 
\ No newline at end of file
+import importlib
+
+# Submodules are imported on first access so that importing one light component
+# (e.g. ``components.api_serving``) does not pull in pandas, nltk or transformers.
+__all__ = ["data_ingestion", "data_standerization", "data_transofrmation", "data_validation"]
+
+
+def __getattr__(name):
+    if name in __all__:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
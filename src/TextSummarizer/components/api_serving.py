@@ -0,0 +1,137 @@
+import multiprocessing
+import os
+import shutil
+import signal
+import socket
+import tempfile
+from multiprocessing.connection import wait
+from typing import List, Optional
+from TextSummarizer.entity import ServingConfig
+from TextSummarizer.logging import logger
+
+
+THREAD_ENV_VARS = ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS")
+METRICS_DIR_ENV_VAR = "PROMETHEUS_MULTIPROC_DIR"
+
+
+def worker_cpus(index: int, threads_per_worker: int, cpu_count: int) -> List[int]:
+    first = (index * threads_per_worker) % cpu_count
+    return [(first + offset) % cpu_count for offset in range(min(threads_per_worker, cpu_count))]
+
+
+def pin_worker(index: int, threads_per_worker: int, pin_cpus: bool):
+    """Limit this process to ``threads_per_worker`` intra-op threads and, optionally, its own CPU cores.
+
+    Must run before torch does any parallel work, so thread env vars are set before it is imported.
+    """
+    for env_var in THREAD_ENV_VARS:
+        os.environ[env_var] = str(threads_per_worker)
+
+    import torch
+    torch.set_num_threads(threads_per_worker)
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        # Inter-op pool already started in this process; keep its size
+        pass
+
+    if pin_cpus:
+        import psutil
+        cpus = worker_cpus(index, threads_per_worker, psutil.cpu_count(logical=True) or 1)
+        try:
+            psutil.Process().cpu_affinity(cpus)
+            logger.info(f"Worker {index} pinned to CPUs {cpus} with {threads_per_worker} torch threads")
+        except (AttributeError, NotImplementedError, psutil.Error) as e:
+            logger.warning(f"Worker {index} could not set CPU affinity: {e}")
+    else:
+        logger.info(f"Worker {index} running with {threads_per_worker} torch threads")
+
+
+def run_api_worker(index: int, sock: socket.socket, config: ServingConfig):
+    pin_worker(index, config.threads_per_worker, config.pin_cpus)
+
+    import uvicorn
+    from TextSummarizer.routes.inferance import create_app
+
+    server = uvicorn.Server(uvicorn.Config(create_app(), host=config.host, port=config.port))
+    server.run(sockets=[sock])
+
+
+def _raise_keyboard_interrupt(signum, frame):
+    raise KeyboardInterrupt
+
+
+class ApiServer:
+    """Serves the API from ``workers`` processes that share one listening socket.
+
+    Workers write their Prometheus samples to ``PROMETHEUS_MULTIPROC_DIR`` so that /metrics,
+    whichever worker answers it, reports all of them. The directory is taken from the
+    environment or created per run, emptied before the workers start, and a worker's live
+    gauges are dropped when it exits.
+    """
+
+    def __init__(self, config: ServingConfig):
+        self.config = config
+        self.processes: List[multiprocessing.Process] = []
+        self._metrics_dir: Optional[str] = None
+
+    def prepare_metrics_dir(self):
+        """Point PROMETHEUS_MULTIPROC_DIR at an empty directory; spawned workers inherit it."""
+        metrics_dir = os.environ.get(METRICS_DIR_ENV_VAR)
+        if metrics_dir:
+            # Samples of a previous run would be aggregated with this one's
+            shutil.rmtree(metrics_dir, ignore_errors=True)
+            os.makedirs(metrics_dir, exist_ok=True)
+        else:
+            metrics_dir = self._metrics_dir = tempfile.mkdtemp(prefix="summarizer-metrics-")
+            os.environ[METRICS_DIR_ENV_VAR] = metrics_dir
+        logger.info(f"Collecting worker metrics in {metrics_dir}")
+
+    def _worker_exited(self, process: multiprocessing.Process):
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(process.pid)
+        logger.info(f"API worker {process.name} (pid {process.pid}) exited with code {process.exitcode}")
+
+    def bind_socket(self) -> socket.socket:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind((self.config.host, self.config.port))
+        sock.listen(2048)
+        sock.set_inheritable(True)
+        return sock
+
+    def run(self):
+        sock = self.bind_socket()
+        self.prepare_metrics_dir()
+        signal.signal(signal.SIGTERM, _raise_keyboard_interrupt)
+        logger.info(f"Serving on http://{self.config.host}:{self.config.port} with {self.config.workers} workers")
+        context = multiprocessing.get_context("spawn")
+        try:
+            for index in range(self.config.workers):
+                process = context.Process(
+                    target=run_api_worker,
+                    args=(index, sock, self.config),
+                    name=f"summarizer-api-{index}"
+                )
+                process.start()
+                self.processes.append(process)
+                logger.info(f"Started API worker {index} with pid {process.pid}")
+
+            running = {process.sentinel: process for process in self.processes}
+            while running:
+                for sentinel in wait(list(running)):
+                    process = running.pop(sentinel)
+                    process.join()
+                    self._worker_exited(process)
+        except KeyboardInterrupt:
+            logger.info("Shutting down API workers")
+        finally:
+            for process in self.processes:
+                if process.is_alive():
+                    process.terminate()
+                    process.join()
+                    self._worker_exited(process)
+            sock.close()
+            if self._metrics_dir:
+                shutil.rmtree(self._metrics_dir, ignore_errors=True)
@@ -1,18 +1,218 @@
 import os
+import json
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import re
 import nltk
-from typing import Set, Optional, List, Union
+from typing import Dict, Set, Optional, List, Tuple, Union
 from  TextSummarizer.logging import logger
 from TextSummarizer.entity import DataStandardizationConfig
 from TextSummarizer.utils.lib_utils import *
 
+
+NON_LETTER_PATTERN = re.compile(r'[^a-zA-Z\s]')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
+def clean_series(series: pd.Series) -> pd.Series:
+    """Vectorized ``DataStandardization.clean_text``: the same strings, a whole column per pass.
+
+    Only ASCII letters and whitespace survive the first replacement, and collapsing ``\\s+``
+    runs and stripping matches ``' '.join(text.split())`` because both use ``str.isspace``.
+    """
+    return (series.fillna("").astype(str)
+            .str.lower()
+            .str.replace(NON_LETTER_PATTERN, "", regex=True)
+            .str.replace(WHITESPACE_PATTERN, " ", regex=True)
+            .str.strip())
+
+
+class LemmaMemo:
+    """A bounded token -> lemma table in front of the WordNet lemmatizer.
+
+    A corpus has a few tens of thousands of distinct words but millions of occurrences, so
+    each word is lemmatized once and then looked up. The table stops growing at
+    ``max_entries``; words seen after that are still lemmatized, just not remembered. With
+    ``path`` the table is loaded at start and saved by ``save``, and WordNet is only loaded
+    on the first miss, so a warm rerun over the same corpus never touches it.
+    """
+
+    def __init__(self, path: Optional[str] = None, max_entries: int = 500000):
+        self.path = path
+        self.max_entries = max(0, int(max_entries))
+        self.table: Dict[str, str] = {}
+        # Pool workers set this to a dict to collect entries added since the last ``drain_learned``
+        self.learned: Optional[Dict[str, str]] = None
+        self._lemmatizer = None
+        self._dirty = False
+        self.load()
+
+    def load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+            if stored.get('nltk_version') != nltk.__version__:
+                logger.info(f"Lemma table {self.path} was built with another NLTK version; rebuilding")
+                return
+            lemmas = stored['lemmas']
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Could not read lemma table {self.path}: {e}")
+            return
+        self.table = dict(list(lemmas.items())[:self.max_entries])
+        logger.info(f"Loaded {len(self.table)} lemmas from {self.path}")
+
+    def save(self):
+        if not self.path or not self._dirty:
+            return
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'nltk_version': nltk.__version__, 'lemmas': self.table}, f)
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+        logger.info(f"Saved {len(self.table)} lemmas to {self.path}")
+
+    def update(self, lemmas: Dict[str, str]):
+        for word, lemma in lemmas.items():
+            if len(self.table) >= self.max_entries:
+                break
+            if word not in self.table:
+                self.table[word] = lemma
+                self._dirty = True
+
+    def drain_learned(self) -> Dict[str, str]:
+        learned, self.learned = self.learned or {}, {}
+        return learned
+
+    @property
+    def lemmatizer(self):
+        if self._lemmatizer is None:
+            try:
+                from nltk.stem import WordNetLemmatizer
+                lemmatizer = WordNetLemmatizer()
+                lemmatizer.lemmatize('warmup')
+            except LookupError:
+                logger.info("Downloading required models for lemmatization...")
+                nltk.download('wordnet')
+                from nltk.stem import WordNetLemmatizer
+                lemmatizer = WordNetLemmatizer()
+            self._lemmatizer = lemmatizer
+        return self._lemmatizer
+
+    def lemmatize(self, word: str) -> str:
+        lemma = self.table.get(word)
+        if lemma is None:
+            lemma = self.lemmatizer.lemmatize(word)
+            if len(self.table) < self.max_entries:
+                self.table[word] = lemma
+                if self.learned is not None:
+                    self.learned[word] = lemma
+                self._dirty = True
+        return lemma
+
+
+def load_stopwords(custom_stopwords: Optional[Set[str]] = None) -> frozenset:
+    try:
+        from nltk.corpus import stopwords
+        stop_words = set(stopwords.words('english'))
+    except LookupError:
+        logger.info("Downloading stopwords...")
+        nltk.download('stopwords')
+        from nltk.corpus import stopwords
+        stop_words = set(stopwords.words('english'))
+    if custom_stopwords:
+        stop_words.update(custom_stopwords)
+        logger.debug(f"Added {len(custom_stopwords)} custom stopwords")
+    return frozenset(stop_words)
+
+
+class StandardizedArtifactWriter:
+    """Writes the standardized corpus incrementally as a columnar artifact, plus an optional CSV export.
+
+    ``.arrow`` artifacts are uncompressed Arrow IPC streams, the format that
+    ``datasets.Dataset.from_file`` memory-maps without copying. ``.parquet`` artifacts are
+    compressed and smaller on disk. The artifact only stores ``columns``; the CSV export keeps
+    every column. Files are written under temporary names and moved into place by ``close``.
+    """
+
+    def __init__(self, artifact_path: str, columns: List[str], csv_path: Optional[str] = None):
+        self.artifact_path = artifact_path
+        self.columns = list(columns)
+        self.csv_path = csv_path
+        self.schema = pa.schema([(column, pa.large_string()) for column in self.columns])
+        self._tmp_paths = {path: f"{path}.{os.getpid()}.tmp" for path in (artifact_path, csv_path) if path}
+        self._writer = None
+        self._sink = None
+        self._csv_started = False
+        self.rows = 0
+
+    def _open(self):
+        tmp_path = self._tmp_paths[self.artifact_path]
+        if str(self.artifact_path).endswith('.parquet'):
+            self._writer = pq.ParquetWriter(tmp_path, self.schema)
+        else:
+            self._sink = pa.OSFile(tmp_path, 'wb')
+            self._writer = pa.ipc.new_stream(self._sink, self.schema)
+
+    def write(self, df: pd.DataFrame):
+        if self._writer is None:
+            self._open()
+        self._writer.write_table(pa.Table.from_pandas(df[self.columns], schema=self.schema, preserve_index=False))
+        if self.csv_path:
+            df.to_csv(self._tmp_paths[self.csv_path], mode='a' if self._csv_started else 'w', header=not self._csv_started, index=False)
+            self._csv_started = True
+        self.rows += len(df)
+
+    def _close_writer(self):
+        if self._writer is not None:
+            self._writer.close()
+        if self._sink is not None:
+            self._sink.close()
+
+    def close(self):
+        if self._writer is None:
+            self._open()
+        self._close_writer()
+        if self.csv_path and not self._csv_started:
+            pd.DataFrame(columns=self.columns).to_csv(self._tmp_paths[self.csv_path], index=False)
+        for path, tmp_path in self._tmp_paths.items():
+            os.replace(tmp_path, path)
+        logger.info(f"Wrote {self.rows} standardized rows to {self.artifact_path}" + (f" and {self.csv_path}" if self.csv_path else ""))
+
+    def abort(self):
+        self._close_writer()
+        for tmp_path in self._tmp_paths.values():
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+
+# The standardizer of a pool worker process, built once by ``_init_standardization_worker``
+_worker_standardizer = None
+
+
+def _init_standardization_worker(config: DataStandardizationConfig, remove_stops: bool, lemmatize: bool,
+                                 custom_stopwords: Optional[Set[str]]):
+    global _worker_standardizer
+    _worker_standardizer = DataStandardization(config, remove_stops, lemmatize, custom_stopwords, download_models=False)
+    _worker_standardizer.lemmas.learned = {}
+
+
+def _standardize_chunk(texts: List[str]) -> Tuple[List[str], Dict[str, str]]:
+    standardized = [_worker_standardizer.standardize_cleaned_text(text) for text in texts]
+    return standardized, _worker_standardizer.lemmas.drain_learned()
+
+
 class DataStandardization:
     def __init__(self, 
                  config: DataStandardizationConfig,
                  remove_stops: bool = True,
                  lemmatize: bool = True,
-                 custom_stopwords: Optional[Set[str]] = None):
+                 custom_stopwords: Optional[Set[str]] = None,
+                 download_models: bool = True):
         logger.info("Initializing DataStandardization with config")
         self.config = config
         self.remove_stops = remove_stops
@@ -21,13 +221,21 @@ class DataStandardization:
         self.main_csv_path = os.path.join(self.config.input_file_directory,self.config.ALL_REQUIRED_FILES[0]) 
         self.transcripts_csv_path = os.path.join(self.config.input_file_directory,self.config.ALL_REQUIRED_FILES[1])
         self.text_columns = self.config.text_columns
+        self.workers = self.config.workers or os.cpu_count() or 1
+        self.chunk_size = max(1, self.config.chunk_size)
+        # A pool kept open across the chunks of ``standardize_in_chunks``
+        self._executor: Optional[ProcessPoolExecutor] = None
         logger.debug(f"Set up paths - Main CSV: {self.main_csv_path}, Transcripts CSV: {self.transcripts_csv_path}")
-        self.setup_nlp_utilities()
+        self.setup_nlp_utilities(download_models)
         
-    def setup_nlp_utilities(self):
+    def setup_nlp_utilities(self, download_models: bool = True):
         logger.info("Setting up NLP utilities")
         setup_nltk_environment(self.config.nltk_dir)
-        download_nltk_models(self.config.nltk_dir)
+        if download_models:
+            download_nltk_models(self.config.nltk_dir)
+        # Loaded once here instead of on every cell
+        self.stop_words = load_stopwords(self.custom_stopwords) if self.remove_stops else frozenset()
+        self.lemmas = LemmaMemo(self.config.lemma_cache_file, self.config.lemma_cache_size)
         logger.info("NLP utilities setup completed")
 
     def clean_text(self, text: str) -> str:
@@ -40,7 +248,7 @@ class DataStandardization:
         text = str(text).lower()
         
         # Remove special characters and digits
-        text = re.sub(r'[^a-zA-Z\s]', '', text)
+        text = NON_LETTER_PATTERN.sub('', text)
         
         # Remove extra whitespace
         text = ' '.join(text.split())
@@ -54,17 +262,11 @@ class DataStandardization:
             logger.warning("Received empty text for stopwords removal")
             return ""
             
-        try:
-            from nltk.corpus import stopwords
-            stop_words = set(stopwords.words('english'))
-            if custom_stopwords:
-                stop_words.update(custom_stopwords)
-                logger.debug(f"Added {len(custom_stopwords)} custom stopwords")
-        except LookupError:
-            logger.info("Downloading stopwords...")
-            nltk.download('stopwords')
-            from nltk.corpus import stopwords
-            stop_words = set(stopwords.words('english'))
+        if not self.stop_words:
+            self.stop_words = load_stopwords(self.custom_stopwords)
+        stop_words = self.stop_words
+        if custom_stopwords and not stop_words.issuperset(custom_stopwords):
+            stop_words = stop_words | frozenset(custom_stopwords)
         
         words = text.split()
         filtered_words = [word for word in words if word not in stop_words]
@@ -77,17 +279,8 @@ class DataStandardization:
             logger.warning("Received empty text for lemmatization")
             return ""
             
-        try:
-            from nltk.stem import WordNetLemmatizer
-            lemmatizer = WordNetLemmatizer()
-        except LookupError:
-            logger.info("Downloading required models for lemmatization...")
-            nltk.download('wordnet')
-            from nltk.stem import WordNetLemmatizer
-            lemmatizer = WordNetLemmatizer()
-        
         words = text.split()
-        lemmatized_words = [lemmatizer.lemmatize(word) for word in words]
+        lemmatized_words = [self.lemmas.lemmatize(word) for word in words]
         logger.debug("Lemmatization completed")
         return ' '.join(lemmatized_words)
 
@@ -95,7 +288,9 @@ class DataStandardization:
         logger.debug("Starting text standardization")
         # Clean the text first
         text = self.clean_text(text)
-        
+        return self.standardize_cleaned_text(text)
+
+    def standardize_cleaned_text(self, text: str) -> str:
         # Remove stopwords if requested
         if self.remove_stops:
             text = self.remove_stopwords(text, self.custom_stopwords)
@@ -107,28 +302,77 @@ class DataStandardization:
         logger.debug("Text standardization completed")
         return text
 
+    def standardize_cleaned_series(self, series: pd.Series) -> pd.Series:
+        """Apply ``standardize_cleaned_text`` to every cell, across a process pool when configured.
+
+        Cells are split into ``chunk_size`` chunks and ``Executor.map`` returns their results
+        in submission order, so the output order does not depend on which worker finishes
+        first. Each worker sets up NLTK once and sends back the lemmas it learned, which are
+        merged into this process's lemma table.
+        """
+        workers = self.workers if self._executor else min(self.workers, -(-len(series) // self.chunk_size))
+        if workers <= 1:
+            return series.map(self.standardize_cleaned_text)
+
+        texts = series.tolist()
+        chunks = [texts[start:start + self.chunk_size] for start in range(0, len(texts), self.chunk_size)]
+        logger.info(f"Standardizing {len(texts)} cells in {len(chunks)} chunks across {workers} worker processes")
+        standardized = []
+        executor = self._executor or self._create_pool(workers)
+        try:
+            for chunk_result, learned in executor.map(_standardize_chunk, chunks):
+                standardized.extend(chunk_result)
+                self.lemmas.update(learned)
+        finally:
+            if executor is not self._executor:
+                executor.shutdown()
+        return pd.Series(standardized, index=series.index, dtype=object)
+
+    def _create_pool(self, workers: int) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_standardization_worker,
+            initargs=(self.config, self.remove_stops, self.lemmatize, self.custom_stopwords)
+        )
+
     def process_dataframe(self, 
                          df: pd.DataFrame, 
                          suffix: str = '_standardized') -> pd.DataFrame:
+        result_df = self._standardize_frame(df, suffix)
+        self.lemmas.save()
+        
+        logger.info("DataFrame processing completed")
+        return result_df
+
+    def _standardize_frame(self, df: pd.DataFrame, suffix: str, copy: bool = True) -> pd.DataFrame:
         logger.info(f"Processing DataFrame with {len(df)} rows")
         # Create a copy of the DataFrame to avoid modifying the original
-        result_df = df.copy()
+        result_df = df.copy() if copy else df
         
-        # Process each text column
         for column in self.text_columns:
             if column not in df.columns:
                 logger.error(f"Column '{column}' not found in DataFrame")
                 raise ValueError(f"Column '{column}' not found in DataFrame")
-                
+
+        if not self.text_columns:
+            logger.info("No text columns configured; nothing to standardize")
+            return result_df
+
+        # Clean all text columns together in a few vectorized passes
+        cleaned = clean_series(pd.concat([df[column] for column in self.text_columns], ignore_index=True))
+
+        if self.remove_stops or self.lemmatize:
+            cleaned = self.standardize_cleaned_series(cleaned)
+
+        # Process each text column
+        for position, column in enumerate(self.text_columns):
             # Create new column name
             new_column = f"{column}{suffix}"
             logger.info(f"Processing column: {column} -> {new_column}")
             
-            # Apply standardization to the column
-            result_df[new_column] = df[column].apply(self.standardize_text)
+            result_df[new_column] = cleaned.iloc[position * len(df):(position + 1) * len(df)].set_axis(df.index)
             logger.debug(f"Completed processing column: {column}")
-        
-        logger.info("DataFrame processing completed")
+
         return result_df
 
     def load_and_prepare_data(self) -> pd.DataFrame:
@@ -156,13 +400,74 @@ class DataStandardization:
         
         return merged_df
 
+    def load_metadata_index(self) -> pd.DataFrame:
+        """The relevant fields of the main CSV, indexed by the merging key for chunk joins."""
+        merging_key = self.config.merging_key
+        logger.debug(f"Loading main data from {self.main_csv_path}")
+        usecols = list(dict.fromkeys([*self.config.relevant_fields, merging_key]))
+        df_main = pd.read_csv(self.main_csv_path, usecols=usecols)
+        logger.info(f"Loaded main data with {len(df_main)} rows")
+        # ``usecols`` keeps file order; restore the configured order that ``load_and_prepare_data`` produces
+        columns = [field for field in self.config.relevant_fields if field != merging_key]
+        return df_main.set_index(merging_key)[columns]
+
+    def standardize_in_chunks(self, suffix: str = '_standardized') -> int:
+        """Stream ``transcripts.csv`` through join, standardization and save, one chunk at a time.
+
+        Each chunk of ``stream_chunk_rows`` transcripts is joined against the indexed metadata
+        table, standardized and appended to the output artifact, so peak memory follows the
+        chunk size rather than the corpus size. Columns match ``load_and_prepare_data``; rows
+        come out in transcript order. The outputs are written to temporary files and moved
+        into place at the end, so a failed run never leaves a partial artifact behind.
+        Returns the number of rows written.
+        """
+        merging_key = self.config.merging_key
+        metadata = self.load_metadata_index()
+        metadata_columns = list(metadata.columns)
+        writer = self.artifact_writer(suffix)
+
+        logger.info(f"Streaming {self.transcripts_csv_path} in chunks of {self.config.stream_chunk_rows} rows")
+        if self.workers > 1:
+            self._executor = self._create_pool(self.workers)
+        try:
+            chunks = pd.read_csv(self.transcripts_csv_path, chunksize=self.config.stream_chunk_rows)
+            for index, chunk in enumerate(chunks):
+                joined = chunk.join(metadata, on=merging_key, how='inner')
+                transcript_columns = [column for column in chunk.columns if column != merging_key]
+                joined = joined[metadata_columns + transcript_columns].reset_index(drop=True)
+                standardized = self._standardize_frame(joined, suffix, copy=False)
+                writer.write(standardized)
+                logger.info(f"Chunk {index}: {len(chunk)} transcripts, {len(standardized)} joined rows ({writer.rows} written)")
+            writer.close()
+        except Exception:
+            writer.abort()
+            raise
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+            self.lemmas.save()
+
+        return writer.rows
+
+    def artifact_writer(self, suffix: str = '_standardized') -> StandardizedArtifactWriter:
+        """A writer for the columnar artifact holding the standardized text columns, and the CSV export if enabled."""
+        csv_path = os.path.join(self.config.output_dir, self.config.output_file) if self.config.export_csv else None
+        return StandardizedArtifactWriter(
+            artifact_path=os.path.join(self.config.output_dir, self.config.artifact_file),
+            columns=[f"{column}{suffix}" for column in self.text_columns],
+            csv_path=csv_path
+        )
+
     def save_data(self, data):
-        standerised_data_path = os.path.join(self.config.output_dir, self.config.output_file)
-        logger.info(f"Saving standardized data to {standerised_data_path}")
+        writer = self.artifact_writer()
+        logger.info(f"Saving standardized data to {writer.artifact_path}")
         try:
             # Save the standardized data
-            data.to_csv(standerised_data_path, index=False)
+            writer.write(data)
+            writer.close()
             logger.info("Data successfully saved")
         except Exception as e:
+            writer.abort()
             logger.error(f"Error saving data: {str(e)}")
             raise
\ No newline at end of file
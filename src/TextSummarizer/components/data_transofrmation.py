@@ -8,6 +8,15 @@ from sklearn.model_selection import train_test_split
 from datasets import DatasetDict, load_dataset 
 
 
+def load_standardized_dataset(path, dataset_type: str = None, cache_dir: str = None) -> Dataset:
+    """Load the standardized corpus; ``.arrow`` artifacts are memory-mapped without parsing or copying."""
+    path = str(path)
+    dataset_type = dataset_type or os.path.splitext(path)[1].lstrip(".")
+    if dataset_type == "arrow":
+        return Dataset.from_file(path)
+    return load_dataset(dataset_type, data_files=path, cache_dir=cache_dir)["train"]
+
+
 class DataTransformation:
     def __init__(self, config: DataTransformationConfig):
         logger.info("Initializing DataTransformation with config")
@@ -21,10 +30,10 @@ class DataTransformation:
         self.prefix = self.config.prefix
         logger.info(f"Initialized with checkpoint={self.checkpoint}, max_length={self.max_length}, min_length={self.min_length}, dataset_path={self.dataset_path}, sample_size={self.sample_size}")
  
-    def load_data_into_DatasetDict(self, dataset_type: str = "csv") -> DatasetDict:
+    def load_data_into_DatasetDict(self, dataset_type: str = None) -> DatasetDict:
         logger.info("Loading data into DatasetDict")
-        dataset = load_dataset(dataset_type, data_files=self.dataset_path)
-        logger.info(f"Loaded dataset with {dataset_type} from {self.dataset_path}")
+        dataset = DatasetDict({"train": load_standardized_dataset(self.dataset_path, dataset_type)})
+        logger.info(f"Loaded dataset from {self.dataset_path}")
 
         # Ensure required columns exist
         required_features = ['transcript_standardized', 'description_standardized', 'title_standardized']
@@ -32,9 +41,10 @@ class DataTransformation:
         assert all(col in feature_names for col in required_features), f"Missing required columns: {required_features}"
         logger.info(f"Dataset contains required features: {required_features}")
 
-        # Remove unnecessary columns
-        logger.info("Removing unnecessary columns: ['description', 'tags', 'title', 'ratings', 'transcript']")
-        dataset = dataset.remove_columns(['description', 'tags', 'title', 'ratings', 'transcript'])
+        # Remove unnecessary columns (columnar artifacts are written without them)
+        unnecessary_columns = [col for col in ['description', 'tags', 'title', 'ratings', 'transcript'] if col in feature_names]
+        logger.info(f"Removing unnecessary columns: {unnecessary_columns}")
+        dataset = dataset.remove_columns(unnecessary_columns)
 
         # Standardize column names
         logger.info("Renaming columns to standardized names")
@@ -0,0 +1,153 @@
+import json
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+import psutil
+from TextSummarizer.components.summary_writer import insert_unordered
+from TextSummarizer.logging import logger
+
+
+def iter_record_batches(source, batch_size: int) -> Iterator[Tuple[int, object]]:
+    """Yield ``(first row, batch)`` for a CSV/Parquet path, DataFrame, Arrow table or HF ``Dataset``.
+
+    Batches stay in their columnar form until ``batch_records`` converts them, so batches that a
+    resumed upload skips are never turned into Python dicts.
+    """
+    offset = 0
+    if isinstance(source, (str, Path)):
+        if str(source).endswith(".parquet"):
+            import pyarrow.parquet as pq
+
+            batches = pq.ParquetFile(source).iter_batches(batch_size=batch_size)
+        else:
+            import pandas as pd
+
+            batches = pd.read_csv(source, chunksize=batch_size)
+    elif hasattr(source, "iloc"):
+        batches = (source.iloc[start:start + batch_size] for start in range(0, len(source), batch_size))
+    elif hasattr(source, "to_batches"):
+        batches = source.to_batches(max_chunksize=batch_size)
+    elif hasattr(source, "with_format"):
+        batches = source.with_format("arrow").iter(batch_size=batch_size)
+    else:
+        raise TypeError(f"Cannot upload a dataset of type {type(source).__name__}")
+
+    for batch in batches:
+        yield offset, batch
+        offset += batch_length(batch)
+
+
+def batch_length(batch) -> int:
+    return len(batch) if hasattr(batch, "iloc") else batch.num_rows
+
+
+def batch_records(batch) -> List[Dict]:
+    if hasattr(batch, "iloc"):
+        return batch.to_dict("records")
+    return batch.to_pylist()
+
+
+def default_source_id(source) -> Optional[str]:
+    if isinstance(source, (str, Path)):
+        stat = os.stat(source)
+        return f"{Path(source).name}:{stat.st_size}:{stat.st_mtime_ns}"
+    return getattr(source, "_fingerprint", None)
+
+
+class DatasetUploader:
+    """Streams a dataset into a MongoDB collection in concurrent, resumable batches.
+
+    The source is read ``batch_size`` rows at a time, and up to ``concurrency`` unordered
+    ``insert_many`` calls run at once. At most twice that many batches are held in memory, so
+    memory is bounded by the batch size rather than the dataset size. With ``checkpoint_path``
+    every fully written batch is recorded there, and a rerun on the same source skips those
+    batches. Rows get deterministic ids derived from the source and row number, so a batch
+    that was in flight when an upload died is not duplicated when it is sent again.
+    """
+
+    def __init__(self, collection, batch_size: int = 1000, concurrency: int = 4, checkpoint_path=None,
+                 max_retries: int = 5, retry_backoff_s: float = 0.5):
+        self.collection = collection
+        self.batch_size = max(1, int(batch_size))
+        self.concurrency = max(1, int(concurrency))
+        self.checkpoint_path = checkpoint_path
+        self.max_retries = max_retries
+        self.retry_backoff_s = retry_backoff_s
+        self._process = psutil.Process(os.getpid())
+
+    def _load_checkpoint(self, source_id: str) -> Set[int]:
+        if not self.checkpoint_path or not os.path.exists(self.checkpoint_path):
+            return set()
+        with open(self.checkpoint_path, "r", encoding="utf-8") as f:
+            checkpoint = json.load(f)
+        if checkpoint.get("source_id") != source_id or checkpoint.get("batch_size") != self.batch_size:
+            logger.warning(f"Checkpoint {self.checkpoint_path} is for another source or batch size; starting over")
+            return set()
+        logger.info(f"Resuming upload of {source_id}: {len(checkpoint['completed'])} batches already written")
+        return set(checkpoint["completed"])
+
+    def _save_checkpoint(self, source_id: str, completed: Set[int], finished: bool = False):
+        if not self.checkpoint_path:
+            return
+        os.makedirs(os.path.dirname(self.checkpoint_path) or ".", exist_ok=True)
+        tmp_path = f"{self.checkpoint_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"source_id": source_id, "batch_size": self.batch_size, "completed": sorted(completed), "finished": finished}, f)
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def _insert(self, source_id: Optional[str], offset: int, batch) -> Tuple[int, int]:
+        records = batch_records(batch)
+        if source_id is not None:
+            for row, record in enumerate(records, start=offset):
+                record.setdefault("_id", f"{source_id}:{row}")
+        return insert_unordered(self.collection, records, self.max_retries, self.retry_backoff_s)
+
+    def upload(self, source, source_id: Optional[str] = None) -> Dict:
+        source_id = source_id or default_source_id(source)
+        if self.checkpoint_path and source_id is None:
+            raise ValueError("A source_id is required to checkpoint an upload of an in-memory dataset")
+        completed = self._load_checkpoint(source_id)
+
+        report = {"source_id": source_id, "rows": 0, "rows_written": 0, "rows_failed": 0, "batches_skipped": 0}
+        peak_rss = self._process.memory_info().rss
+        started = time.perf_counter()
+
+        def _finish(future):
+            nonlocal peak_rss
+            index = running.pop(future)
+            written, failed = future.result()
+            report["rows_written"] += written
+            report["rows_failed"] += failed
+            peak_rss = max(peak_rss, self._process.memory_info().rss)
+            if not failed:
+                completed.add(index)
+                self._save_checkpoint(source_id, completed)
+
+        running = {}
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="dataset-upload") as executor:
+            for index, (offset, batch) in enumerate(iter_record_batches(source, self.batch_size)):
+                report["rows"] += batch_length(batch)
+                if index in completed:
+                    report["batches_skipped"] += 1
+                    continue
+                while len(running) >= 2 * self.concurrency:
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        _finish(future)
+                running[executor.submit(self._insert, source_id, offset, batch)] = index
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    _finish(future)
+
+        elapsed = time.perf_counter() - started
+        self._save_checkpoint(source_id, completed, finished=report["rows_failed"] == 0)
+        report["seconds"] = round(elapsed, 3)
+        report["rows_per_s"] = round(report["rows_written"] / elapsed, 1) if elapsed > 0 else 0.0
+        report["peak_rss_mb"] = round(peak_rss / 2 ** 20, 1)
+        logger.info(f"Dataset upload finished: {report}")
+        if report["rows_failed"]:
+            logger.error(f"{report['rows_failed']} rows were not written; rerun the upload to resume")
+        return report
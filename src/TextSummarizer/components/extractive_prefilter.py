@@ -0,0 +1,185 @@
+import json
+import math
+import os
+import re
+import threading
+from collections import Counter
+from typing import Callable, Dict, List, Optional
+from TextSummarizer.logging import logger
+
+
+SENTENCE_SPLIT_PATTERN = re.compile(r"(?<=[.!?])\s+")
+WORD_PATTERN = re.compile(r"[a-z]+")
+
+
+def split_sentences(text: str) -> List[str]:
+    return [sentence.strip() for sentence in SENTENCE_SPLIT_PATTERN.split(str(text)) if sentence.strip()]
+
+
+def corpus_fingerprint(path) -> str:
+    stat = os.stat(path)
+    return f"{os.path.abspath(path)}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+class ExtractivePrefilter:
+    """Shrinks long inputs to their most central sentences before abstractive generation.
+
+    Sentences are TF-IDF vectors, similarity is their cosine, and TextRank (PageRank over the
+    similarity graph) scores them. The top-ranked sentences are kept, in their original order,
+    until ``budget`` model tokens are used. IDF comes from the standardized TED corpus and is
+    cached in ``idf_cache_path``. The standardized text has no stopwords, so words outside
+    its vocabulary weigh nothing. Without a corpus, sentences of the input serve as documents.
+
+    Term and similarity matrices are sparse, and documents with more than ``max_sentences``
+    sentences are ranked in consecutive blocks of that size, so memory stays bounded by the
+    block rather than growing with the square of the document length. numpy and scipy are
+    imported when a text is first ranked, so API workers do not load them at startup.
+    """
+
+    def __init__(self, idf_cache_path, corpus_path=None, corpus_column: str = "transcript_standardized",
+                 damping: float = 0.85, max_iterations: int = 100, tolerance: float = 1e-6, max_sentences: int = 512):
+        self.idf_cache_path = idf_cache_path
+        self.corpus_path = corpus_path
+        self.corpus_column = corpus_column
+        self.damping = damping
+        self.max_iterations = max_iterations
+        self.tolerance = tolerance
+        self.max_sentences = max(2, int(max_sentences))
+        self.idf: Optional[Dict[str, float]] = None
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def ensure_loaded(self):
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            self.idf = self._load_idf()
+            self._loaded = True
+
+    def _load_idf(self) -> Optional[Dict[str, float]]:
+        if not self.corpus_path or not os.path.exists(self.corpus_path):
+            logger.warning(f"Standardized corpus {self.corpus_path} not found; extractive pre-filter uses in-document IDF")
+            return None
+        fingerprint = corpus_fingerprint(self.corpus_path)
+        try:
+            with open(self.idf_cache_path, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+            if cached["fingerprint"] == fingerprint:
+                logger.info(f"Loaded IDF for {len(cached['idf'])} terms from {self.idf_cache_path}")
+                return cached["idf"]
+        except (OSError, ValueError, KeyError):
+            pass
+        return self._build_idf(fingerprint)
+
+    def _read_corpus_column(self):
+        path = str(self.corpus_path)
+        if path.endswith(".arrow"):
+            import pyarrow as pa
+
+            with pa.memory_map(path) as source:
+                return pa.ipc.open_stream(source).read_all().column(self.corpus_column).to_pandas()
+        import pandas as pd
+
+        if path.endswith(".parquet"):
+            return pd.read_parquet(path, columns=[self.corpus_column])[self.corpus_column]
+        return pd.read_csv(path, usecols=[self.corpus_column])[self.corpus_column]
+
+    def _build_idf(self, fingerprint: str) -> Dict[str, float]:
+        logger.info(f"Computing IDF from column '{self.corpus_column}' of {self.corpus_path}")
+        documents = self._read_corpus_column().fillna("").astype(str)
+        document_frequency = Counter()
+        for document in documents:
+            document_frequency.update(set(WORD_PATTERN.findall(document.lower())))
+        total = len(documents)
+        idf = {term: math.log((1 + total) / (1 + count)) + 1 for term, count in document_frequency.items()}
+
+        os.makedirs(os.path.dirname(self.idf_cache_path) or ".", exist_ok=True)
+        tmp_path = f"{self.idf_cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"fingerprint": fingerprint, "documents": total, "idf": idf}, f)
+        os.replace(tmp_path, self.idf_cache_path)
+        logger.info(f"Cached IDF for {len(idf)} terms from {total} documents in {self.idf_cache_path}")
+        return idf
+
+    def _term_weights(self, vocabulary: List[str], sentence_term_counts: "scipy.sparse.csr_matrix") -> "numpy.ndarray":
+        import numpy as np
+
+        if self.idf is None:
+            document_frequency = sentence_term_counts.getnnz(axis=0)
+            return np.log((1 + sentence_term_counts.shape[0]) / (1 + document_frequency)) + 1
+        weights = np.zeros(len(vocabulary))
+        for index, term in enumerate(vocabulary):
+            # The corpus is lemmatized; fall back to the singular for plain plurals
+            weight = self.idf.get(term)
+            if weight is None and term.endswith("s"):
+                weight = self.idf.get(term[:-1])
+            weights[index] = weight or 0.0
+        return weights
+
+    def rank(self, sentences: List[str]) -> "numpy.ndarray":
+        """TextRank score of every sentence over its TF-IDF cosine similarity graph."""
+        import numpy as np
+
+        n = len(sentences)
+        if n <= self.max_sentences:
+            return self._rank_block(sentences)
+        blocks = [sentences[start:start + self.max_sentences] for start in range(0, n, self.max_sentences)]
+        # Scores of a block sum to one; weight them by block size so blocks compare
+        return np.concatenate([self._rank_block(block) * len(block) / n for block in blocks])
+
+    def _rank_block(self, sentences: List[str]) -> "numpy.ndarray":
+        import numpy as np
+        from scipy import sparse
+
+        n = len(sentences)
+        tokens = [WORD_PATTERN.findall(sentence.lower()) for sentence in sentences]
+        vocabulary, term_ids = np.unique(np.array([token for sentence in tokens for token in sentence], dtype=object), return_inverse=True)
+        sentence_ids = np.repeat(np.arange(n), [len(sentence) for sentence in tokens])
+        # Duplicate (sentence, term) pairs are summed into counts
+        counts = sparse.csr_matrix((np.ones(len(term_ids)), (sentence_ids, term_ids.ravel())), shape=(n, len(vocabulary)))
+
+        vectors = sparse.csr_matrix(counts.multiply(self._term_weights(list(vocabulary), counts)))
+        norms = np.sqrt(np.asarray(vectors.multiply(vectors).sum(axis=1)).ravel())
+        inverse_norms = np.divide(1.0, norms, out=np.zeros_like(norms), where=norms > 0)
+        vectors = sparse.diags(inverse_norms) @ vectors
+        similarity = sparse.csr_matrix(vectors @ vectors.T)
+        similarity.setdiag(0.0)
+        similarity.eliminate_zeros()
+
+        out_weight = np.asarray(similarity.sum(axis=1)).ravel()
+        inverse_out_weight = np.divide(1.0, out_weight, out=np.zeros_like(out_weight), where=out_weight > 0)
+        transition_t = sparse.csr_matrix((sparse.diags(inverse_out_weight) @ similarity).T)
+        dangling = out_weight <= 0
+        scores = np.full(n, 1.0 / n)
+        for _ in range(self.max_iterations):
+            # Sentences without any similar sentence spread their rank uniformly
+            updated = (1 - self.damping) / n + self.damping * (transition_t @ scores + scores[dangling].sum() / n)
+            if np.abs(updated - scores).sum() < self.tolerance:
+                scores = updated
+                break
+            scores = updated
+        return scores
+
+    def filter(self, text: str, budget: int, token_lengths: Callable[[List[str]], List[int]]) -> str:
+        """Keep the top-ranked sentences of ``text`` that fit in ``budget`` tokens, in document order."""
+        import numpy as np
+
+        self.ensure_loaded()
+        sentences = split_sentences(text)
+        if len(sentences) < 2:
+            return text
+        lengths = np.array(token_lengths(sentences))
+        if lengths.sum() <= budget:
+            return text
+
+        scores = self.rank(sentences)
+        selected = np.zeros(len(sentences), dtype=bool)
+        used = 0
+        for index in np.argsort(-scores, kind="stable"):
+            if used + lengths[index] <= budget or not selected.any():
+                selected[index] = True
+                used += lengths[index]
+        logger.info(f"Extractive pre-filter kept {int(selected.sum())}/{len(sentences)} sentences ({used}/{int(lengths.sum())} tokens)")
+        return " ".join(sentence for sentence, keep in zip(sentences, selected) if keep)
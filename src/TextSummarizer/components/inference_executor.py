@@ -0,0 +1,112 @@
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Tuple
+from TextSummarizer.components.micro_batcher import QueueFullError, TimedFuture
+from TextSummarizer.components.inference_metrics import QUEUE_DEPTH, QUEUE_WAIT
+from TextSummarizer.logging import logger
+
+
+_worker_target = None
+
+
+def _init_process_worker(target_class: type):
+    global _worker_target
+    _worker_target = target_class()
+    if hasattr(_worker_target, "warmup"):
+        _worker_target.warmup()
+    if hasattr(_worker_target, "start_model_watcher"):
+        _worker_target.start_model_watcher()
+
+
+def _timed_call(target, method: str, args: tuple, enqueued_at: float) -> Tuple[Any, float, float]:
+    started = time.time()
+    result = getattr(target, method)(*args)
+    return result, (started - enqueued_at) * 1000, (time.time() - started) * 1000
+
+
+def _run_in_process_worker(method: str, args: tuple, enqueued_at: float) -> Tuple[Any, float, float]:
+    return _timed_call(_worker_target, method, args, enqueued_at)
+
+
+class InferenceExecutor:
+    """Runs blocking pipeline methods on a bounded thread or process pool.
+
+    At most ``max_workers + max_queue_size`` calls are accepted at once; further submissions
+    raise ``QueueFullError`` so callers can shed load instead of queueing without limit.
+    Work that runs outside the pool, such as a streamed summary, can hold one of those slots
+    with ``reserve`` and ``release``.
+    In process mode every worker builds and warms its own instance of ``target``'s class.
+    """
+
+    def __init__(self, target, executor_type: str = "thread", max_workers: int = 2, max_queue_size: int = 32):
+        self.target = target
+        self.executor_type = executor_type
+        self.max_workers = max(1, int(max_workers))
+        self.capacity = self.max_workers + max(0, int(max_queue_size))
+        self._slots = threading.BoundedSemaphore(self.capacity)
+        self._pending = 0
+        self._pending_lock = threading.Lock()
+
+        if executor_type == "thread":
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="summarizer-worker")
+        elif executor_type == "process":
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_init_process_worker,
+                initargs=(type(target),)
+            )
+        else:
+            raise ValueError(f"Unsupported executor type: {executor_type}")
+        logger.info(f"Inference executor started with {self.max_workers} {executor_type} workers and capacity {self.capacity}")
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def reserve(self):
+        """Take one slot of the capacity, or raise ``QueueFullError``; every reservation needs a ``release``."""
+        if not self._slots.acquire(blocking=False):
+            raise QueueFullError(f"Inference queue is full ({self.capacity} pending requests)")
+        with self._pending_lock:
+            self._pending += 1
+        QUEUE_DEPTH.labels("executor").inc()
+
+    def release(self):
+        with self._pending_lock:
+            self._pending -= 1
+        QUEUE_DEPTH.labels("executor").dec()
+        self._slots.release()
+
+    def submit(self, method: str, *args) -> TimedFuture:
+        self.reserve()
+        enqueued_at = time.time()
+        try:
+            if self.executor_type == "thread":
+                inner = self._executor.submit(_timed_call, self.target, method, args, enqueued_at)
+            else:
+                inner = self._executor.submit(_run_in_process_worker, method, args, enqueued_at)
+        except Exception:
+            self.release()
+            raise
+
+        outer = TimedFuture()
+
+        def _resolve(done: Future):
+            self.release()
+            if done.cancelled():
+                outer.cancel()
+                return
+            error = done.exception()
+            if error is not None:
+                outer.set_exception(error)
+                return
+            result, outer.queue_wait_ms, outer.compute_ms = done.result()
+            QUEUE_WAIT.labels("executor").observe(outer.queue_wait_ms / 1000)
+            outer.set_result(result)
+
+        inner.add_done_callback(_resolve)
+        return outer
+
+    def shutdown(self, wait: bool = False):
+        self._executor.shutdown(wait=wait, cancel_futures=True)
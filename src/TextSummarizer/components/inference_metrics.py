@@ -0,0 +1,86 @@
+import time
+from contextlib import contextmanager
+from prometheus_client import Counter, Gauge, Histogram
+
+# Under ``serve`` every worker process writes its samples to PROMETHEUS_MULTIPROC_DIR and
+# /metrics aggregates them, so gauges are set when their value changes rather than read
+# through ``set_function`` at scrape time, and declare how the workers' values combine.
+
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+TOKEN_BUCKETS = (8, 16, 32, 64, 128, 256, 512, 1024, 2048, 4096)
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64)
+
+REQUESTS = Counter(
+    "summarizer_requests_total",
+    "HTTP requests handled by the summarizer API",
+    ["route", "method", "status"],
+)
+REQUEST_ERRORS = Counter(
+    "summarizer_request_errors_total",
+    "HTTP requests that ended in a server error or an unhandled exception",
+    ["route", "method"],
+)
+REQUEST_LATENCY = Histogram(
+    "summarizer_request_latency_seconds",
+    "End-to-end HTTP request latency",
+    ["route", "method"],
+    buckets=LATENCY_BUCKETS,
+)
+PHASE_LATENCY = Histogram(
+    "summarizer_phase_latency_seconds",
+    "Latency of each inference phase per generate call",
+    ["phase"],
+    buckets=LATENCY_BUCKETS,
+)
+QUEUE_WAIT = Histogram(
+    "summarizer_queue_wait_seconds",
+    "Time a request waited before inference started",
+    ["queue"],
+    buckets=LATENCY_BUCKETS,
+)
+TIME_TO_FIRST_TOKEN = Histogram(
+    "summarizer_time_to_first_token_seconds",
+    "Time until the first streamed token was produced",
+    buckets=LATENCY_BUCKETS,
+)
+INPUT_TOKENS = Histogram(
+    "summarizer_input_tokens",
+    "Input tokens per document after truncation",
+    buckets=TOKEN_BUCKETS,
+)
+OUTPUT_TOKENS = Histogram(
+    "summarizer_output_tokens",
+    "Generated tokens per summary",
+    buckets=TOKEN_BUCKETS,
+)
+BATCH_SIZE = Histogram(
+    "summarizer_batch_size",
+    "Documents per generate call",
+    buckets=BATCH_SIZE_BUCKETS,
+)
+QUEUE_DEPTH = Gauge(
+    "summarizer_queue_depth",
+    "Requests currently waiting or running in an inference queue",
+    ["queue"],
+    multiprocess_mode="livesum",
+)
+CACHE_LOOKUPS = Counter(
+    "summarizer_cache_lookups_total",
+    "Summary cache lookups by outcome",
+    ["result"],
+)
+CACHE_HIT_RATE = Gauge(
+    "summarizer_cache_hit_rate",
+    "Share of summary cache lookups served from memory or disk",
+    multiprocess_mode="liveall",
+)
+
+
+@contextmanager
+def observe_phase(phase: str):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        PHASE_LATENCY.labels(phase).observe(time.perf_counter() - start)
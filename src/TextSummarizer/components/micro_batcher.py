@@ -0,0 +1,173 @@
+import heapq
+import itertools
+import json
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+from TextSummarizer.components.inference_metrics import QUEUE_DEPTH, QUEUE_WAIT
+from TextSummarizer.logging import logger
+
+
+class QueueFullError(RuntimeError):
+    pass
+
+
+class CostLimitExceededError(RuntimeError):
+    """Raised when a request's estimated cost is above the configured admission limit."""
+
+
+class TimedFuture(Future):
+    """A future that also reports how long its work waited in a queue and how long it ran."""
+
+    def __init__(self):
+        super().__init__()
+        self.queue_wait_ms = 0.0
+        self.compute_ms = 0.0
+        self.model_version: Optional[str] = None
+
+
+@dataclass
+class PendingRequest:
+    text: str
+    gen_kwargs: dict
+    model_version: Optional[str] = None
+    cost: float = 0.0
+    future: TimedFuture = field(default_factory=TimedFuture)
+    enqueued_at: float = field(default_factory=time.perf_counter)
+
+
+class SchedulingLane:
+    """A bounded shortest-job-first queue with aging.
+
+    A request's priority is its cost minus ``aging_per_s`` for every second it has waited, so
+    cheap requests go first but an expensive one cannot starve. Every queued request ages at
+    the same rate, so ordering by ``cost + aging_per_s * enqueued_at`` is fixed at insertion
+    and a plain heap is enough.
+    """
+
+    def __init__(self, name: str, max_size: int, aging_per_s: float = 0.0):
+        self.name = name
+        self.max_size = max(1, int(max_size))
+        self.aging_per_s = max(0.0, float(aging_per_s))
+        self._heap = []
+        self._order = itertools.count()
+        self._ready = threading.Condition()
+        self._depth = QUEUE_DEPTH.labels(f"batcher_{name}")
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def put(self, request: PendingRequest):
+        with self._ready:
+            if len(self._heap) >= self.max_size:
+                raise QueueFullError(f"Summarization queue '{self.name}' is full ({self.max_size} pending requests)")
+            priority = request.cost + self.aging_per_s * request.enqueued_at
+            heapq.heappush(self._heap, (priority, next(self._order), request))
+            self._depth.set(len(self._heap))
+            self._ready.notify()
+
+    def get_batch(self, max_batch_size: int, max_wait: float) -> List[PendingRequest]:
+        """Block for the highest-priority request, then gather up to ``max_batch_size`` within ``max_wait``."""
+        with self._ready:
+            while not self._heap:
+                self._ready.wait()
+            batch = [heapq.heappop(self._heap)[2]]
+            deadline = time.monotonic() + max_wait
+            while len(batch) < max_batch_size:
+                if self._heap:
+                    batch.append(heapq.heappop(self._heap)[2])
+                    continue
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._ready.wait(remaining):
+                    break
+            self._depth.set(len(self._heap))
+        return batch
+
+
+class MicroBatcher:
+    """Collects concurrent summarization requests and runs them as one padded generate call.
+
+    Requests are routed into named lanes (by default ``short`` and ``long``), each with its own
+    queue and worker threads, so long transcripts never wait in front of one-sentence inputs.
+    Within a lane the cheapest request is served first, with aging. A batch is dispatched as
+    soon as it holds ``max_batch_size`` requests or ``max_wait_ms`` has passed since its first
+    request was taken. Requests with different generation kwargs or model versions share the
+    wait window but are generated in separate calls.
+    """
+
+    def __init__(self,
+                 summarize_fn: Callable[[List[str], dict, Optional[str]], List[str]],
+                 max_batch_size: int = 8,
+                 max_wait_ms: float = 10,
+                 max_queue_size: int = 256,
+                 lane_workers: Optional[Dict[str, int]] = None,
+                 aging_per_s: float = 0.0):
+        self.summarize_fn = summarize_fn
+        self.max_batch_size = max(1, int(max_batch_size))
+        self.max_wait = max(0.0, float(max_wait_ms)) / 1000
+        self.lane_workers = {name: max(1, int(workers)) for name, workers in (lane_workers or {"short": 1}).items()}
+        self.lanes = {name: SchedulingLane(name, max_queue_size, aging_per_s) for name in self.lane_workers}
+        self._workers: List[threading.Thread] = []
+        self._worker_lock = threading.Lock()
+
+    @property
+    def queue_depth(self) -> int:
+        return sum(len(lane) for lane in self.lanes.values())
+
+    def lane_depth(self, lane: str) -> int:
+        return len(self.lanes[lane])
+
+    def submit(self, text: str, gen_kwargs: dict, model_version: Optional[str] = None,
+               cost: float = 0.0, lane: Optional[str] = None) -> TimedFuture:
+        lane = lane or next(iter(self.lanes))
+        if lane not in self.lanes:
+            raise ValueError(f"Unknown scheduling lane '{lane}'. Available lanes: {list(self.lanes)}")
+        self._ensure_workers()
+        request = PendingRequest(text=text, gen_kwargs=gen_kwargs, model_version=model_version, cost=cost)
+        request.future.model_version = model_version
+        self.lanes[lane].put(request)
+        return request.future
+
+    def _ensure_workers(self):
+        if self._workers and all(worker.is_alive() for worker in self._workers):
+            return
+        with self._worker_lock:
+            alive = [worker for worker in self._workers if worker.is_alive()]
+            for name, workers in self.lane_workers.items():
+                running = sum(worker.name.startswith(f"summarizer-batcher-{name}-") for worker in alive)
+                for index in range(running, workers):
+                    worker = threading.Thread(target=self._run, args=(self.lanes[name],), name=f"summarizer-batcher-{name}-{index}", daemon=True)
+                    worker.start()
+                    alive.append(worker)
+            self._workers = alive
+
+    def _run(self, lane: SchedulingLane):
+        while True:
+            batch = lane.get_batch(self.max_batch_size, self.max_wait)
+            groups: Dict[str, List[PendingRequest]] = {}
+            for request in batch:
+                if request.future.set_running_or_notify_cancel():
+                    key = json.dumps([request.model_version, request.gen_kwargs], sort_keys=True)
+                    groups.setdefault(key, []).append(request)
+
+            for requests in groups.values():
+                self._execute(lane.name, requests)
+
+    def _execute(self, lane: str, requests: List[PendingRequest]):
+        logger.info(f"Running {lane} summarization batch of size {len(requests)}")
+        started = time.perf_counter()
+        try:
+            summaries = self.summarize_fn([request.text for request in requests], requests[0].gen_kwargs, requests[0].model_version)
+        except Exception as e:
+            logger.error(f"Summarization batch failed: {e}")
+            for request in requests:
+                request.future.set_exception(e)
+            return
+        compute_ms = (time.perf_counter() - started) * 1000
+        for request, summary in zip(requests, summaries):
+            request.future.queue_wait_ms = (started - request.enqueued_at) * 1000
+            QUEUE_WAIT.labels(f"batcher_{lane}").observe(request.future.queue_wait_ms / 1000)
+            request.future.compute_ms = compute_ms
+            request.future.set_result(summary)
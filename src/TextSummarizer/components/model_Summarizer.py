@@ -1,4 +1,5 @@
 import numpy as np
+import torch
 from transformers import AutoTokenizer ,AutoModelForSeq2SeqLM, Seq2SeqTrainingArguments, Seq2SeqTrainer
 from transformers import Seq2SeqTrainingArguments, Seq2SeqTrainer
 import evaluate
@@ -10,6 +11,7 @@ from TextSummarizer.utils.config_utils import *
 from TextSummarizer.utils.lib_utils import *
 from  TextSummarizer.logging import logger
 from TextSummarizer.entity import TrainingConfig
+from TextSummarizer.components.model_versions import publish_model_version
 
 
 class SummarizationModel:
@@ -18,7 +20,7 @@ class SummarizationModel:
         self.config = config
         self.data_path = self.config.data_path
         self.output_dir = self.config.output_dir
-        self.device = self.config.device
+        self.device = self.config.device or ("cuda" if torch.cuda.is_available() else "cpu")
         self.checkpoint = self.config.checkpoint
         self.max_length = self.config.max_length
         self.min_length = self.config.min_length
@@ -88,6 +90,8 @@ class SummarizationModel:
         logger.info("Saving model to output directory: %s", self.output_dir)
         model.save_model(self.output_dir,model_name)
         logger.info("Model saved successfully.")
+        version = publish_model_version(model, self.config.versions_dir)
+        logger.info("Model published as version %s; running APIs will swap to it.", version)
 
     def predict(self, text: str) -> str:
         logger.info("Generating summary for input text.")
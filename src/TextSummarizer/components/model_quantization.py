@@ -0,0 +1,52 @@
+import os
+import time
+import torch
+from transformers import AutoModelForSeq2SeqLM
+from TextSummarizer.components.summary_cache import fingerprint_model
+from TextSummarizer.logging import logger
+
+
+QUANTIZED_MODEL_FILE = "model.pt"
+SOURCE_FINGERPRINT_FILE = "source_fingerprint.txt"
+
+
+def quantized_model_dir(model_path) -> str:
+    return f"{os.path.normpath(str(model_path))}_int8"
+
+
+def quantize_dynamic_int8(model):
+    """Apply dynamic int8 quantization to every ``nn.Linear`` layer of ``model``."""
+    model.eval()
+    return torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+
+def load_int8_model(model_path):
+    """Load the int8 version of ``model_path``, quantizing and caching it next to the original if needed.
+
+    The cached artifact is reused only while the fingerprint of the source model matches, so a
+    retrained model is quantized again on its first load.
+    """
+    cache_dir = quantized_model_dir(model_path)
+    artifact_path = os.path.join(cache_dir, QUANTIZED_MODEL_FILE)
+    fingerprint_path = os.path.join(cache_dir, SOURCE_FINGERPRINT_FILE)
+    source_fingerprint = fingerprint_model(model_path)
+
+    if os.path.exists(artifact_path) and os.path.exists(fingerprint_path):
+        with open(fingerprint_path, "r") as f:
+            cached_fingerprint = f.read().strip()
+        if cached_fingerprint == source_fingerprint:
+            logger.info(f"Loading cached int8 model from {artifact_path}")
+            return torch.load(artifact_path, weights_only=False)
+        logger.info(f"Cached int8 model in {cache_dir} is stale, quantizing again")
+
+    start = time.perf_counter()
+    model = AutoModelForSeq2SeqLM.from_pretrained(model_path)
+    quantized = quantize_dynamic_int8(model)
+    logger.info(f"Quantized {model_path} to int8 in {time.perf_counter() - start:.2f}s")
+
+    os.makedirs(cache_dir, exist_ok=True)
+    torch.save(quantized, artifact_path)
+    with open(fingerprint_path, "w") as f:
+        f.write(source_fingerprint)
+    logger.info(f"Saved int8 model to {artifact_path}")
+    return quantized
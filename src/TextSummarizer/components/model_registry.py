@@ -0,0 +1,288 @@
+import gc
+import os
+import threading
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+from TextSummarizer.components.summary_cache import fingerprint_model
+from TextSummarizer.components.inference_metrics import BATCH_SIZE, INPUT_TOKENS, OUTPUT_TOKENS, observe_phase
+from TextSummarizer.logging import logger
+
+
+class LoadedSummarizer:
+    """A tokenizer/model pair loaded once and shared by every caller in the process.
+
+    torch and transformers are imported on first load, not at import time, so processes that
+    only route or configure requests start without paying for them.
+    """
+
+    NOT_LOADED = "not_loaded"
+    LOADING = "loading"
+    READY = "ready"
+    FAILED = "failed"
+
+    BACKENDS = ("pytorch", "int8", "onnx")
+
+    def __init__(self, model_path: str, tokenizer_path: str, backend: str = "pytorch"):
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unsupported inference backend '{backend}'. Available backends: {self.BACKENDS}")
+        self.model_path = model_path
+        self.tokenizer_path = tokenizer_path
+        self.backend = backend
+        self.state = self.NOT_LOADED
+        self.error: Optional[str] = None
+        self.tokenizer = None
+        self.model = None
+        self.fingerprint: Optional[str] = None
+        self.in_flight = 0
+        self._lock = threading.Lock()
+        self._idle = threading.Condition()
+
+    @property
+    def is_ready(self) -> bool:
+        return self.state == self.READY
+
+    def ensure_loaded(self, warmup_text: Optional[str] = None):
+        if self.is_ready:
+            return
+        with self._lock:
+            if self.is_ready:
+                return
+            self.state = self.LOADING
+            self.error = None
+            try:
+                self._load()
+                if warmup_text:
+                    self._warmup(warmup_text)
+                self.state = self.READY
+            except Exception as e:
+                self.state = self.FAILED
+                self.error = str(e)
+                logger.error(f"Failed to load summarizer from {self.model_path}: {e}")
+                raise
+
+    def acquire(self):
+        with self._idle:
+            self.in_flight += 1
+
+    def release(self):
+        with self._idle:
+            self.in_flight -= 1
+            if self.in_flight <= 0:
+                self._idle.notify_all()
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """Block until no request holds this summarizer; returns False if ``timeout`` ran out first."""
+        with self._idle:
+            return self._idle.wait_for(lambda: self.in_flight <= 0, timeout=timeout)
+
+    def unload(self):
+        """Drop the model and tokenizer so their memory can be reclaimed."""
+        with self._lock:
+            self.model = None
+            self.tokenizer = None
+            self.state = self.NOT_LOADED
+        gc.collect()
+        import torch
+        if torch.cuda.is_available():
+            torch.cuda.empty_cache()
+        logger.info(f"Unloaded summarizer from {self.model_path}")
+
+    def _load(self):
+        from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
+        from TextSummarizer.components.model_quantization import load_int8_model
+        from TextSummarizer.components.onnx_runtime import load_onnx_model
+
+        start = time.perf_counter()
+        logger.info(f"Loading tokenizer from {self.tokenizer_path} and {self.backend} model from {self.model_path}")
+        self.tokenizer = AutoTokenizer.from_pretrained(self.tokenizer_path)
+        # Generation calls the tokenizer and model directly, so no transformers pipeline is built
+        if self.backend == "onnx":
+            self.model = load_onnx_model(self.model_path)
+        elif self.backend == "int8":
+            self.model = load_int8_model(self.model_path)
+        else:
+            self.model = AutoModelForSeq2SeqLM.from_pretrained(self.model_path)
+        self.fingerprint = fingerprint_model(self.model_path)
+        if self.backend != "pytorch":
+            self.fingerprint = f"{self.fingerprint}-{self.backend}"
+        logger.info(f"Summarizer loaded in {time.perf_counter() - start:.2f}s")
+
+    def _warmup(self, text: str):
+        start = time.perf_counter()
+        self._generate([text], max_length=16)
+        logger.info(f"Summarizer warmed up in {time.perf_counter() - start:.2f}s")
+
+    def token_lengths(self, texts: List[str]) -> List[int]:
+        if not self.is_ready:
+            raise RuntimeError(f"Summarizer for {self.model_path} is not ready (state: {self.state})")
+        encoded = self.tokenizer(texts, add_special_tokens=True, truncation=False)
+        return [len(input_ids) for input_ids in encoded["input_ids"]]
+
+    def split_into_windows(self, text: str, window_size: int, overlap: int) -> List[str]:
+        """Split ``text`` into overlapping windows of at most ``window_size`` tokens."""
+        if not self.is_ready:
+            raise RuntimeError(f"Summarizer for {self.model_path} is not ready (state: {self.state})")
+        if not 0 <= overlap < window_size:
+            raise ValueError(f"Chunk overlap ({overlap}) must be smaller than the chunk size ({window_size})")
+        input_ids = self.tokenizer(text, add_special_tokens=False)["input_ids"]
+        if len(input_ids) <= window_size:
+            return [text]
+
+        windows = []
+        stride = window_size - overlap
+        for start in range(0, len(input_ids), stride):
+            window_ids = input_ids[start:start + window_size]
+            windows.append(self.tokenizer.decode(window_ids, skip_special_tokens=True))
+            if start + window_size >= len(input_ids):
+                break
+        return windows
+
+    def summarize(self, texts: List[str], **gen_kwargs) -> List[str]:
+        if not self.is_ready:
+            raise RuntimeError(f"Summarizer for {self.model_path} is not ready (state: {self.state})")
+        return self._generate(texts, **gen_kwargs)
+
+    def _generate(self, texts: List[str], **gen_kwargs) -> List[str]:
+        """Run one padded generate call, timing tokenize, encoder, decode and detokenize separately."""
+        import torch
+
+        model = self.model
+        prefix = getattr(model.config, "prefix", None) or ""
+        BATCH_SIZE.observe(len(texts))
+
+        with observe_phase("tokenize"):
+            inputs = self.tokenizer(
+                [prefix + text for text in texts],
+                padding=True,
+                truncation=True,
+                return_tensors="pt"
+            ).to(model.device)
+        for input_tokens in inputs["attention_mask"].sum(dim=1).tolist():
+            INPUT_TOKENS.observe(input_tokens)
+
+        with torch.no_grad():
+            with observe_phase("encoder"):
+                encoder_outputs = model.get_encoder()(
+                    input_ids=inputs["input_ids"],
+                    attention_mask=inputs["attention_mask"],
+                    return_dict=True
+                )
+            with observe_phase("decode"):
+                output_ids = model.generate(
+                    attention_mask=inputs["attention_mask"],
+                    encoder_outputs=encoder_outputs,
+                    **gen_kwargs
+                )
+
+        with observe_phase("detokenize"):
+            summaries = self.tokenizer.batch_decode(output_ids, skip_special_tokens=True, clean_up_tokenization_spaces=False)
+        pad_token_id = self.tokenizer.pad_token_id
+        for output_tokens in (output_ids != pad_token_id).sum(dim=1).tolist():
+            OUTPUT_TOKENS.observe(output_tokens)
+        return summaries
+
+    def stream(self, text: str, **gen_kwargs) -> Iterator[str]:
+        """Yield decoded text pieces while ``generate`` is still running (greedy or sampling only).
+
+        Closing the iterator early, e.g. when the client goes away, stops generation at the next
+        token and returns once the generate thread has exited.
+        """
+        import torch
+        from transformers import StoppingCriteria, StoppingCriteriaList, TextIteratorStreamer
+
+        class _Cancelled(StoppingCriteria):
+            def __call__(self, input_ids, scores, **kwargs):
+                return torch.full((input_ids.shape[0],), cancel.is_set(), dtype=torch.bool, device=input_ids.device)
+
+        if not self.is_ready:
+            raise RuntimeError(f"Summarizer for {self.model_path} is not ready (state: {self.state})")
+        model = self.model
+        prefix = getattr(model.config, "prefix", None) or ""
+        inputs = self.tokenizer(prefix + text, truncation=True, return_tensors="pt").to(model.device)
+        streamer = TextIteratorStreamer(self.tokenizer, skip_prompt=True, skip_special_tokens=True)
+        cancel = threading.Event()
+        errors = []
+
+        def _generate():
+            try:
+                model.generate(**inputs, streamer=streamer, stopping_criteria=StoppingCriteriaList([_Cancelled()]),
+                               **{"num_beams": 1, **gen_kwargs})
+            except Exception as e:
+                errors.append(e)
+                streamer.end()
+
+        thread = threading.Thread(target=_generate, name="summarizer-stream", daemon=True)
+        thread.start()
+        try:
+            for piece in streamer:
+                if piece:
+                    yield piece
+        finally:
+            cancel.set()
+            thread.join()
+        if errors:
+            raise errors[0]
+
+
+class ModelRegistry:
+    """Process-wide registry of loaded summarizers keyed by (model path, tokenizer path, backend)."""
+
+    _entries: Dict[Tuple[str, str, str], LoadedSummarizer] = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _key(model_path, tokenizer_path, backend: str) -> Tuple[str, str, str]:
+        return os.path.abspath(str(model_path)), os.path.abspath(str(tokenizer_path)), backend
+
+    @classmethod
+    def entry(cls, model_path, tokenizer_path, backend: str = "pytorch") -> LoadedSummarizer:
+        key = cls._key(model_path, tokenizer_path, backend)
+        with cls._lock:
+            if key not in cls._entries:
+                cls._entries[key] = LoadedSummarizer(*key)
+            return cls._entries[key]
+
+    @classmethod
+    def get(cls, model_path, tokenizer_path, warmup_text: Optional[str] = None, backend: str = "pytorch") -> LoadedSummarizer:
+        summarizer = cls.entry(model_path, tokenizer_path, backend)
+        summarizer.ensure_loaded(warmup_text)
+        return summarizer
+
+    @classmethod
+    def is_ready(cls, model_path, tokenizer_path, backend: str = "pytorch") -> bool:
+        key = cls._key(model_path, tokenizer_path, backend)
+        with cls._lock:
+            summarizer = cls._entries.get(key)
+        return summarizer is not None and summarizer.is_ready
+
+    @classmethod
+    def evict(cls, model_path, tokenizer_path, backend: str = "pytorch") -> Optional[LoadedSummarizer]:
+        key = cls._key(model_path, tokenizer_path, backend)
+        with cls._lock:
+            return cls._entries.pop(key, None)
+
+    @classmethod
+    def discard(cls, summarizer: LoadedSummarizer) -> bool:
+        """Remove ``summarizer`` from the registry if it is still the registered entry for its key."""
+        key = (summarizer.model_path, summarizer.tokenizer_path, summarizer.backend)
+        with cls._lock:
+            if cls._entries.get(key) is not summarizer:
+                return False
+            del cls._entries[key]
+            return True
+
+    @classmethod
+    def status(cls) -> List[Dict[str, Optional[str]]]:
+        with cls._lock:
+            entries = list(cls._entries.values())
+        return [
+            {
+                "model": summarizer.model_path,
+                "tokenizer": summarizer.tokenizer_path,
+                "backend": summarizer.backend,
+                "state": summarizer.state,
+                "in_flight": summarizer.in_flight,
+                "error": summarizer.error,
+            }
+            for summarizer in entries
+        ]
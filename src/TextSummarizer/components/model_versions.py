@@ -0,0 +1,97 @@
+import os
+import re
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+from TextSummarizer.logging import logger
+
+
+CURRENT_VERSION_FILE = "CURRENT"
+UNVERSIONED = "unversioned"
+# ``new_version_id`` output; versions published before the random suffix have none
+VERSION_ID_PATTERN = re.compile(r"\d{8}-\d{6}(-[0-9a-f]+)?")
+
+
+@dataclass(frozen=True)
+class ModelVersion:
+    version: str
+    model_path: str
+    tokenizer_path: str
+
+
+def new_version_id() -> str:
+    # The suffix keeps two publishes within the same second apart
+    return f"{datetime.now():%Y%m%d-%H%M%S}-{uuid.uuid4().hex[:6]}"
+
+
+def list_versions(versions_dir) -> List[str]:
+    """Published versions: directories named like ``new_version_id`` that hold a saved model.
+
+    Backend caches derived from a version (``<version>_int8``, ``<version>_onnx``) sit next to
+    it and are not versions themselves.
+    """
+    versions_dir = Path(versions_dir)
+    if not versions_dir.is_dir():
+        return []
+    return sorted(
+        p.name for p in versions_dir.iterdir()
+        if p.is_dir() and VERSION_ID_PATTERN.fullmatch(p.name) and (p / "config.json").is_file()
+    )
+
+
+def current_version(versions_dir) -> Optional[str]:
+    try:
+        with open(os.path.join(versions_dir, CURRENT_VERSION_FILE), "r") as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+
+def set_current_version(versions_dir, version: str):
+    """Point ``CURRENT`` at ``version``; the pointer is replaced atomically so readers never see a partial write."""
+    pointer = os.path.join(versions_dir, CURRENT_VERSION_FILE)
+    if version == UNVERSIONED:
+        if os.path.exists(pointer):
+            os.remove(pointer)
+        logger.info("Current model version reset to the unversioned model")
+        return
+    if version not in list_versions(versions_dir):
+        raise ValueError(f"Unknown model version '{version}'. Available versions: {list_versions(versions_dir)}")
+    tmp_pointer = f"{pointer}.{os.getpid()}.tmp"
+    with open(tmp_pointer, "w") as f:
+        f.write(version)
+    os.replace(tmp_pointer, pointer)
+    logger.info(f"Current model version set to {version}")
+
+
+def publish_model_version(trainer, versions_dir) -> str:
+    """Save a trained model (and the trainer's tokenizer) as a new version and make it current.
+
+    The model is written to a hidden staging directory first and renamed into place, so a
+    watcher never picks up a half-written version.
+    """
+    version = new_version_id()
+    staging_dir = os.path.join(versions_dir, f".{version}.tmp")
+    version_dir = os.path.join(versions_dir, version)
+    os.makedirs(versions_dir, exist_ok=True)
+    trainer.save_model(staging_dir)
+    os.replace(staging_dir, version_dir)
+    logger.info(f"Published model version {version} to {version_dir}")
+    set_current_version(versions_dir, version)
+    return version
+
+
+def resolve_model_version(versions_dir, fallback_model_path, fallback_tokenizer_path, version: Optional[str] = None) -> ModelVersion:
+    """Resolve ``version`` (default: the current one) to its directory.
+
+    Without any published version the unversioned model and tokenizer paths are used.
+    """
+    version = version or current_version(versions_dir)
+    if version is None or version == UNVERSIONED:
+        return ModelVersion(UNVERSIONED, str(fallback_model_path), str(fallback_tokenizer_path))
+    if version not in list_versions(versions_dir):
+        raise ValueError(f"Unknown model version '{version}'. Available versions: {list_versions(versions_dir)}")
+    version_dir = os.path.join(versions_dir, version)
+    return ModelVersion(version, version_dir, version_dir)
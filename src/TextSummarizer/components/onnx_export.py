@@ -0,0 +1,70 @@
+import json
+import time
+import numpy as np
+from datasets import load_from_disk
+from TextSummarizer.components.model_registry import ModelRegistry
+from TextSummarizer.components.onnx_runtime import export_onnx_model
+from TextSummarizer.entity import OnnxExportConfig
+from TextSummarizer.logging import logger
+
+
+class OnnxExport:
+    """Exports the fine-tuned summarizer to ONNX and checks the ONNX Runtime engine against PyTorch.
+
+    The check runs greedy decoding on both backends over test documents; the export is only
+    considered valid when every summary matches exactly.
+    """
+
+    def __init__(self, config: OnnxExportConfig):
+        logger.info("Initializing OnnxExport with config")
+        self.config = config
+        self.greedy_kwargs = {**self.config.gen_kwargs, "num_beams": 1, "do_sample": False}
+
+    def export(self) -> str:
+        return export_onnx_model(self.config.model_path)
+
+    def load_parity_texts(self):
+        logger.info(f"Loading parity documents from {self.config.test_data_path}")
+        test_split = load_from_disk(self.config.test_data_path)["test"]
+        sample_size = min(self.config.parity_sample_size, len(test_split))
+        return test_split.select(range(sample_size))["text"]
+
+    def _summarize(self, backend: str, texts):
+        summarizer = ModelRegistry.get(self.config.model_path, self.config.tokenizer_path, warmup_text=texts[0], backend=backend)
+        summaries, latencies = [], []
+        for text in texts:
+            start = time.perf_counter()
+            summaries.append(summarizer.summarize([text], **self.greedy_kwargs)[0])
+            latencies.append((time.perf_counter() - start) * 1000)
+        ModelRegistry.evict(self.config.model_path, self.config.tokenizer_path, backend=backend)
+        return summaries, latencies
+
+    def verify_parity(self) -> dict:
+        texts = self.load_parity_texts()
+        torch_summaries, torch_latencies = self._summarize("pytorch", texts)
+        onnx_summaries, onnx_latencies = self._summarize("onnx", texts)
+
+        mismatches = [
+            {"index": index, "pytorch": torch_summary, "onnx": onnx_summary}
+            for index, (torch_summary, onnx_summary) in enumerate(zip(torch_summaries, onnx_summaries))
+            if torch_summary != onnx_summary
+        ]
+        report = {
+            "documents": len(texts),
+            "gen_kwargs": self.greedy_kwargs,
+            "matches": len(texts) - len(mismatches),
+            "parity": not mismatches,
+            "pytorch_latency_ms_mean": round(float(np.mean(torch_latencies)), 2),
+            "onnx_latency_ms_mean": round(float(np.mean(onnx_latencies)), 2),
+            "mismatches": mismatches,
+        }
+        if mismatches:
+            logger.warning(f"ONNX summaries differ from PyTorch on {len(mismatches)} of {len(texts)} documents")
+        else:
+            logger.info(f"ONNX summaries match PyTorch on all {len(texts)} documents")
+        return report
+
+    def save_report(self, report: dict):
+        logger.info(f"Saving ONNX parity report to {self.config.report_file}")
+        with open(self.config.report_file, "w") as f:
+            json.dump(report, f, indent=4)
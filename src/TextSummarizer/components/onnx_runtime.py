@@ -0,0 +1,53 @@
+import os
+import time
+from TextSummarizer.components.summary_cache import fingerprint_model
+from TextSummarizer.logging import logger
+
+
+SOURCE_FINGERPRINT_FILE = "source_fingerprint.txt"
+
+
+def onnx_model_dir(model_path) -> str:
+    return f"{os.path.normpath(str(model_path))}_onnx"
+
+
+def _import_ort_model():
+    try:
+        from optimum.onnxruntime import ORTModelForSeq2SeqLM
+    except ImportError as e:
+        raise ImportError("The onnx backend requires `optimum[onnxruntime]`; install onnx, onnxruntime and optimum") from e
+    return ORTModelForSeq2SeqLM
+
+
+def export_onnx_model(model_path) -> str:
+    """Export the encoder, decoder and decoder-with-past of ``model_path`` to ONNX next to the original."""
+    ORTModelForSeq2SeqLM = _import_ort_model()
+    export_dir = onnx_model_dir(model_path)
+
+    start = time.perf_counter()
+    logger.info(f"Exporting {model_path} to ONNX")
+    ort_model = ORTModelForSeq2SeqLM.from_pretrained(model_path, export=True, use_cache=True)
+    ort_model.save_pretrained(export_dir)
+    with open(os.path.join(export_dir, SOURCE_FINGERPRINT_FILE), "w") as f:
+        f.write(fingerprint_model(model_path))
+    logger.info(f"Exported ONNX model to {export_dir} in {time.perf_counter() - start:.2f}s")
+    return export_dir
+
+
+def is_onnx_export_current(model_path) -> bool:
+    fingerprint_path = os.path.join(onnx_model_dir(model_path), SOURCE_FINGERPRINT_FILE)
+    if not os.path.exists(fingerprint_path):
+        return False
+    with open(fingerprint_path, "r") as f:
+        return f.read().strip() == fingerprint_model(model_path)
+
+
+def load_onnx_model(model_path):
+    """Load the ONNX Runtime model for ``model_path``, exporting it first if it is missing or stale."""
+    ORTModelForSeq2SeqLM = _import_ort_model()
+    if not is_onnx_export_current(model_path):
+        export_onnx_model(model_path)
+    export_dir = onnx_model_dir(model_path)
+    logger.info(f"Loading ONNX Runtime model from {export_dir}")
+    return ORTModelForSeq2SeqLM.from_pretrained(export_dir, use_cache=True)
+
@@ -0,0 +1,92 @@
+import gc
+import json
+import os
+import time
+import numpy as np
+from typing import List, Tuple
+import psutil
+import evaluate
+from datasets import load_from_disk
+from TextSummarizer.components.model_registry import ModelRegistry
+from TextSummarizer.entity import QuantizationComparisonConfig
+from TextSummarizer.logging import logger
+
+
+class QuantizationComparison:
+    """Compares the fp32 and dynamic int8 backends on the held-out test split.
+
+    For each backend it reports load time, resident memory, per-document latency and ROUGE
+    against the reference summaries; the int8 outputs are also scored against the fp32 ones.
+    """
+
+    def __init__(self, config: QuantizationComparisonConfig):
+        logger.info("Initializing QuantizationComparison with config")
+        self.config = config
+        self.process = psutil.Process(os.getpid())
+        self.rouge = evaluate.load("rouge")
+
+    def load_test_split(self):
+        logger.info(f"Loading test split from {self.config.test_data_path}")
+        test_split = load_from_disk(self.config.test_data_path)["test"]
+        sample_size = min(self.config.sample_size, len(test_split))
+        test_split = test_split.select(range(sample_size))
+        logger.info(f"Using {sample_size} test documents")
+        return test_split["text"], test_split["summary"]
+
+    def _rss_mb(self) -> float:
+        return self.process.memory_info().rss / (1024 * 1024)
+
+    def evaluate_backend(self, backend: str, texts, references) -> Tuple[dict, List[str]]:
+        logger.info(f"Evaluating {backend} backend")
+        gc.collect()
+        rss_before = self._rss_mb()
+        start = time.perf_counter()
+        summarizer = ModelRegistry.get(self.config.model_path, self.config.tokenizer_path, warmup_text=texts[0], backend=backend)
+        load_s = time.perf_counter() - start
+        rss_loaded = self._rss_mb()
+
+        predictions, latencies = [], []
+        for text in texts:
+            start = time.perf_counter()
+            predictions.append(summarizer.summarize([text], **self.config.gen_kwargs)[0])
+            latencies.append((time.perf_counter() - start) * 1000)
+
+        report = {
+            "load_s": round(load_s, 3),
+            "rss_mb": round(rss_loaded, 1),
+            "rss_delta_mb": round(rss_loaded - rss_before, 1),
+            "peak_rss_mb": round(self._rss_mb(), 1),
+            "latency_ms_mean": round(float(np.mean(latencies)), 2),
+            "latency_ms_p50": round(float(np.percentile(latencies, 50)), 2),
+            "latency_ms_p95": round(float(np.percentile(latencies, 95)), 2),
+            "rouge": self._rouge(predictions, references),
+        }
+        ModelRegistry.evict(self.config.model_path, self.config.tokenizer_path, backend=backend)
+        del summarizer
+        gc.collect()
+        logger.info(f"{backend} backend report: {report}")
+        return report, predictions
+
+    def _rouge(self, predictions, references) -> dict:
+        result = self.rouge.compute(predictions=predictions, references=references, use_stemmer=True)
+        return {k: round(float(v), 4) for k, v in result.items()}
+
+    def compare(self) -> dict:
+        texts, references = self.load_test_split()
+        fp32_report, fp32_predictions = self.evaluate_backend("pytorch", texts, references)
+        int8_report, int8_predictions = self.evaluate_backend("int8", texts, references)
+        report = {
+            "documents": len(texts),
+            "gen_kwargs": self.config.gen_kwargs,
+            "fp32": fp32_report,
+            "int8": int8_report,
+            "int8_vs_fp32_rouge": self._rouge(int8_predictions, fp32_predictions),
+            "latency_speedup": round(fp32_report["latency_ms_mean"] / int8_report["latency_ms_mean"], 3),
+            "rss_delta_saving_mb": round(fp32_report["rss_delta_mb"] - int8_report["rss_delta_mb"], 1),
+        }
+        return report
+
+    def save_report(self, report: dict):
+        logger.info(f"Saving quantization comparison report to {self.config.report_file}")
+        with open(self.config.report_file, "w") as f:
+            json.dump(report, f, indent=4)
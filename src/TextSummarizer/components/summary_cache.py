@@ -0,0 +1,155 @@
+import hashlib
+import json
+import os
+import shutil
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional
+from TextSummarizer.components.inference_metrics import CACHE_HIT_RATE, CACHE_LOOKUPS
+from TextSummarizer.logging import logger
+
+
+def normalize_text(text: str) -> str:
+    return " ".join(str(text).split())
+
+
+def fingerprint_model(model_path) -> str:
+    """Fingerprint a saved model directory from the name, size and mtime of its files."""
+    digest = hashlib.sha256()
+    model_path = Path(model_path)
+    files = sorted(p for p in model_path.rglob("*") if p.is_file()) if model_path.is_dir() else [model_path]
+    for path in files:
+        stat = path.stat()
+        digest.update(f"{path.relative_to(model_path.parent)}:{stat.st_size}:{stat.st_mtime_ns}\n".encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+class SummaryCache:
+    """Content-addressed summary cache with a bounded in-memory LRU tier and an on-disk tier.
+
+    Entries live under ``cache_dir/<model fingerprint>/``, so retraining invalidates the cache.
+    ``cache_dir`` may be shared by several worker processes that switch models at different
+    times, so the directories of previous models are only removed by ``prune``, which the
+    model swap calls once the old model has drained.
+    """
+
+    def __init__(self, cache_dir, max_entries: int = 1024, enabled: bool = True):
+        self.cache_dir = Path(cache_dir)
+        self.max_entries = max(0, int(max_entries))
+        self.enabled = enabled
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._fingerprint: Optional[str] = None
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(text: str, gen_kwargs: dict, fingerprint: str) -> str:
+        payload = json.dumps(
+            {"text": normalize_text(text), "gen_kwargs": gen_kwargs, "model": fingerprint},
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key: str, fingerprint: str) -> Path:
+        return self.cache_dir / fingerprint / key[:2] / f"{key}.json"
+
+    def _activate(self, fingerprint: str):
+        if fingerprint == self._fingerprint:
+            return
+        with self._lock:
+            if fingerprint == self._fingerprint:
+                return
+            self._memory.clear()
+            self._fingerprint = fingerprint
+
+    def prune(self, keep: str):
+        """Remove the on-disk entries of every model fingerprint other than ``keep``."""
+        if not self.cache_dir.is_dir():
+            return
+        for stale_dir in self.cache_dir.iterdir():
+            if stale_dir.is_dir() and stale_dir.name != keep:
+                logger.info(f"Removing stale summary cache for model {stale_dir.name}")
+                shutil.rmtree(stale_dir, ignore_errors=True)
+
+    def _remember(self, key: str, summary: str):
+        if self.max_entries == 0:
+            return
+        with self._lock:
+            self._memory[key] = summary
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    def get(self, text: str, gen_kwargs: dict, fingerprint: str) -> Optional[str]:
+        if not self.enabled:
+            return None
+        self._activate(fingerprint)
+        key = self.make_key(text, gen_kwargs, fingerprint)
+
+        with self._lock:
+            summary = self._memory.get(key)
+            if summary is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                self._publish_hit_rate()
+                CACHE_LOOKUPS.labels("memory_hit").inc()
+                return summary
+
+        path = self._entry_path(key, fingerprint)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                summary = json.load(f)["summary"]
+        except (OSError, ValueError, KeyError):
+            with self._lock:
+                self.misses += 1
+                self._publish_hit_rate()
+            CACHE_LOOKUPS.labels("miss").inc()
+            return None
+
+        with self._lock:
+            self.disk_hits += 1
+            self._publish_hit_rate()
+        CACHE_LOOKUPS.labels("disk_hit").inc()
+        self._remember(key, summary)
+        return summary
+
+    def put(self, text: str, gen_kwargs: dict, fingerprint: str, summary: str):
+        if not self.enabled:
+            return
+        self._activate(fingerprint)
+        key = self.make_key(text, gen_kwargs, fingerprint)
+        self._remember(key, summary)
+
+        path = self._entry_path(key, fingerprint)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"summary": summary}, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to persist summary cache entry {key}: {e}")
+
+    def _publish_hit_rate(self):
+        # Caller holds ``_lock``
+        hits = self.memory_hits + self.disk_hits
+        CACHE_HIT_RATE.set(hits / (hits + self.misses))
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            hits = self.memory_hits + self.disk_hits
+            lookups = hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "model_fingerprint": self._fingerprint,
+                "memory_entries": len(self._memory),
+                "max_memory_entries": self.max_entries,
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            }
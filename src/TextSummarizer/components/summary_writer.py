@@ -0,0 +1,174 @@
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from bson import ObjectId
+from pymongo.errors import BulkWriteError, PyMongoError
+from TextSummarizer.logging import logger
+
+
+DUPLICATE_KEY_ERROR = 11000
+
+
+def insert_unordered(collection, documents: List[Dict], max_retries: int = 5, retry_backoff_s: float = 0.5) -> Tuple[int, int]:
+    """Insert ``documents`` with unordered ``insert_many``, retrying failures; returns ``(written, failed)``.
+
+    Documents must carry their ``_id``, so duplicate-key errors on a retry mean the document
+    was already written. Only the other failed documents are sent again, with exponential backoff.
+    """
+    pending, written = documents, 0
+    for attempt in range(max_retries + 1):
+        try:
+            collection.insert_many(pending, ordered=False)
+            written += len(pending)
+            pending = []
+        except BulkWriteError as e:
+            errors = e.details.get("writeErrors", [])
+            retry = {error["index"] for error in errors if error.get("code") != DUPLICATE_KEY_ERROR}
+            written += len(pending) - len(retry)
+            pending = [document for index, document in enumerate(pending) if index in retry]
+            if pending:
+                logger.warning(f"Insert attempt {attempt + 1}: {len(pending)} documents failed")
+        except PyMongoError as e:
+            logger.warning(f"Insert attempt {attempt + 1} of {len(pending)} documents failed: {e}")
+        if not pending:
+            break
+        if attempt < max_retries:
+            time.sleep(retry_backoff_s * 2 ** attempt)
+    if pending:
+        logger.error(f"Giving up on {len(pending)} documents after {max_retries + 1} attempts")
+    return written, len(pending)
+
+
+class WriteBehindBuffer:
+    """Buffers documents in memory and writes them to a collection in background batches.
+
+    ``put`` only appends to a bounded deque, so the request path never waits on the database.
+    A flusher thread sends an unordered ``insert_many`` once ``batch_size`` documents are
+    buffered or ``flush_interval_s`` has passed. Every document gets its ``_id`` when it is
+    buffered, so retrying a partly written batch is idempotent (see ``insert_unordered``).
+    When ``max_buffer_size`` documents are already waiting, new ones are dropped and counted
+    rather than growing memory.
+
+    ``collection`` only needs ``insert_many(documents, ordered=False)``, so an in-process
+    stand-in such as ``mongomock`` works for tests.
+    """
+
+    def __init__(self, collection, batch_size: int = 500, flush_interval_s: float = 1.0,
+                 max_buffer_size: int = 10000, max_retries: int = 5, retry_backoff_s: float = 0.5):
+        self.collection = collection
+        self.batch_size = max(1, int(batch_size))
+        self.flush_interval_s = max(0.0, float(flush_interval_s))
+        self.max_buffer_size = max(self.batch_size, int(max_buffer_size))
+        self.max_retries = max(0, int(max_retries))
+        self.retry_backoff_s = max(0.0, float(retry_backoff_s))
+        self._buffer: deque = deque()
+        self._in_flight = 0
+        self._lock = threading.Condition()
+        self._closed = False
+        self._flush_requested = False
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+        self.batches = 0
+        self._thread = threading.Thread(target=self._run, name="write-behind-flusher", daemon=True)
+        self._thread.start()
+
+    def put(self, document: Dict) -> Optional[str]:
+        """Buffer ``document`` for writing and return its id, or ``None`` if it was dropped."""
+        document.setdefault("_id", ObjectId())
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Write-behind buffer is closed")
+            if len(self._buffer) >= self.max_buffer_size:
+                self.dropped += 1
+                if self.dropped == 1 or self.dropped % 1000 == 0:
+                    logger.warning(f"Write-behind buffer is full ({self.max_buffer_size} documents); {self.dropped} dropped so far")
+                return None
+            self._buffer.append(document)
+            # Wake the flusher for a full batch, or to start the interval clock on an idle buffer
+            if len(self._buffer) >= self.batch_size or len(self._buffer) == 1:
+                self._lock.notify_all()
+        return str(document["_id"])
+
+    def _take_batch(self) -> List[Dict]:
+        with self._lock:
+            deadline = time.monotonic() + self.flush_interval_s
+            while len(self._buffer) < self.batch_size and not (self._closed or self._flush_requested):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    if self._buffer:
+                        break
+                    deadline = time.monotonic() + self.flush_interval_s
+                    remaining = self.flush_interval_s
+                self._lock.wait(remaining or None)
+            batch = [self._buffer.popleft() for _ in range(min(self.batch_size, len(self._buffer)))]
+            if not self._buffer:
+                self._flush_requested = False
+            self._in_flight = len(batch)
+            return batch
+
+    def _run(self):
+        while True:
+            batch = self._take_batch()
+            if batch:
+                self._write(batch)
+            with self._lock:
+                self._in_flight = 0
+                self._lock.notify_all()
+                if self._closed and not self._buffer:
+                    return
+
+    def _write(self, batch: List[Dict]):
+        written, failed = insert_unordered(self.collection, batch, self.max_retries, self.retry_backoff_s)
+        self.written += written
+        self.failed += failed
+        self.batches += 1
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Write everything buffered so far without waiting for the interval; ``False`` on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            self._flush_requested = bool(self._buffer)
+            self._lock.notify_all()
+            while self._buffer or self._in_flight:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._lock.wait(remaining)
+        return True
+
+    def close(self, timeout: Optional[float] = 30):
+        """Stop accepting documents, write what is buffered and stop the flusher."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._lock.notify_all()
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            logger.error(f"Write-behind flusher did not finish within {timeout}s; {len(self._buffer)} documents not written")
+        else:
+            logger.info(f"Write-behind buffer closed: {self.stats()}")
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            buffered = len(self._buffer) + self._in_flight
+        return {
+            "buffered": buffered,
+            "written": self.written,
+            "dropped": self.dropped,
+            "failed": self.failed,
+            "batches": self.batches,
+        }
+
+
+def summary_document(text: str, summary: str, model_name: str, **metadata) -> Dict:
+    return {
+        "text": text,
+        "summary": summary,
+        "model": model_name,
+        "created_at": datetime.now(),
+        **metadata,
+    }
@@ -0,0 +1,246 @@
+import json
+import os
+import re
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from collections import deque
+from pathlib import Path
+from typing import Dict, List, Optional
+import psutil
+from TextSummarizer.components.api_serving import THREAD_ENV_VARS
+from TextSummarizer.entity import TrainingJobsConfig
+from TextSummarizer.logging import logger
+
+
+STAGE_NAME_PATTERN = re.compile(r'^STAGE_NAME\s*=\s*["\'](?P<stage>.+)["\']', re.MULTILINE)
+STAGE_EVENT_PATTERN = re.compile(r">+ stage (?P<stage>.+?) (?P<event>started|completed) <+")
+
+
+class JobLimitError(RuntimeError):
+    """Raised when starting a job would exceed ``max_concurrent_jobs``."""
+
+
+def pipeline_stage_names(entry_point) -> List[str]:
+    """Read the ``STAGE_NAME`` assignments of the training entry point, in execution order."""
+    try:
+        with open(entry_point, "r", encoding="utf-8") as f:
+            return STAGE_NAME_PATTERN.findall(f.read())
+    except OSError:
+        return []
+
+
+class TrainingJobManager:
+    """Runs the training pipeline as background processes and tracks them as jobs.
+
+    Each job gets ``root_dir/<job id>/`` holding ``job.json`` and ``train.log``. The training
+    process writes its output straight to the log file and outlives the API process, so stage
+    progress is parsed from the log and any API worker can report on or cancel any job.
+    Training runs at a lower CPU priority with a capped torch thread count so inference keeps
+    its latency on the same host.
+    """
+
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+    def __init__(self, config: TrainingJobsConfig):
+        self.config = config
+        self.root_dir = Path(config.root_dir)
+        self.root_dir.mkdir(parents=True, exist_ok=True)
+        self.stages = pipeline_stage_names(config.entry_point)
+        self._lock = threading.Lock()
+        self._processes: Dict[str, subprocess.Popen] = {}
+
+    def _job_dir(self, job_id: str) -> Path:
+        return self.root_dir / job_id
+
+    def _log_path(self, job_id: str) -> Path:
+        return self._job_dir(job_id) / "train.log"
+
+    def _read_job(self, job_id: str) -> Optional[dict]:
+        try:
+            with open(self._job_dir(job_id) / "job.json", "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_job(self, job: dict):
+        path = self._job_dir(job["job_id"]) / "job.json"
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(job, f, indent=4)
+        os.replace(tmp_path, path)
+
+    def _training_env(self) -> dict:
+        env = os.environ.copy()
+        for env_var in THREAD_ENV_VARS:
+            env[env_var] = str(self.config.torch_threads)
+        env["PYTHONUNBUFFERED"] = "1"
+        return env
+
+    def _lower_priority(self, pid: int):
+        if self.config.niceness <= 0:
+            return
+        try:
+            process = psutil.Process(pid)
+            if os.name == "nt":
+                process.nice(psutil.BELOW_NORMAL_PRIORITY_CLASS)
+            else:
+                process.nice(self.config.niceness)
+        except psutil.Error as e:
+            logger.warning(f"Could not lower the priority of training process {pid}: {e}")
+
+    def _is_alive(self, job: dict) -> bool:
+        try:
+            process = psutil.Process(job["pid"])
+            return abs(process.create_time() - job["process_created_at"]) < 1 and process.status() != psutil.STATUS_ZOMBIE
+        except psutil.Error:
+            return False
+
+    def _stage_progress(self, job_id: str, finished: bool) -> List[dict]:
+        stages = {name: {"name": name, "status": "pending"} for name in self.stages}
+        try:
+            with open(self._log_path(job_id), "r", encoding="utf-8", errors="replace") as f:
+                for line in f:
+                    match = STAGE_EVENT_PATTERN.search(line)
+                    if not match:
+                        continue
+                    stage = stages.setdefault(match["stage"], {"name": match["stage"], "status": "pending"})
+                    stage["status"] = "running" if match["event"] == "started" else "completed"
+        except OSError:
+            pass
+        if finished:
+            for stage in stages.values():
+                if stage["status"] == "running":
+                    stage["status"] = "interrupted"
+        return list(stages.values())
+
+    def _watch(self, job_id: str, process: subprocess.Popen):
+        returncode = process.wait()
+        with self._lock:
+            self._processes.pop(job_id, None)
+            job = self._read_job(job_id)
+            if job is None:
+                return
+            if job["cancel_requested"]:
+                job["status"] = self.CANCELLED
+            else:
+                job["status"] = self.SUCCEEDED if returncode == 0 else self.FAILED
+            job["returncode"] = returncode
+            job["finished_at"] = time.time()
+            self._write_job(job)
+        logger.info(f"Training job {job_id} finished with status {job['status']} (exit code {returncode})")
+
+    def _reconcile(self, job: dict) -> dict:
+        """Finish jobs whose process exited while no API process was watching it."""
+        if job["status"] != self.RUNNING or job["job_id"] in self._processes or self._is_alive(job):
+            return job
+        stages = self._stage_progress(job["job_id"], finished=False)
+        if job["cancel_requested"]:
+            job["status"] = self.CANCELLED
+        else:
+            job["status"] = self.SUCCEEDED if all(s["status"] == "completed" for s in stages) else self.FAILED
+        job["finished_at"] = time.time()
+        self._write_job(job)
+        return job
+
+    def start(self) -> dict:
+        with self._lock:
+            jobs = [job for job in (self._read_job(path.name) for path in self.root_dir.iterdir() if path.is_dir()) if job]
+            running = sum(self._reconcile(job)["status"] == self.RUNNING for job in jobs)
+            if running >= self.config.max_concurrent_jobs:
+                raise JobLimitError(f"{self.config.max_concurrent_jobs} training job(s) already running")
+
+            job_id = uuid.uuid4().hex[:12]
+            self._job_dir(job_id).mkdir(parents=True)
+            command = [sys.executable, str(self.config.entry_point)]
+            with open(self._log_path(job_id), "w", encoding="utf-8") as log_file:
+                process = subprocess.Popen(
+                    command,
+                    stdout=log_file,
+                    stderr=subprocess.STDOUT,
+                    stdin=subprocess.DEVNULL,
+                    env=self._training_env(),
+                )
+            self._lower_priority(process.pid)
+            try:
+                process_created_at = psutil.Process(process.pid).create_time()
+            except psutil.Error:
+                process_created_at = time.time()
+
+            job = {
+                "job_id": job_id,
+                "status": self.RUNNING,
+                "command": command,
+                "pid": process.pid,
+                "process_created_at": process_created_at,
+                "created_at": time.time(),
+                "finished_at": None,
+                "returncode": None,
+                "cancel_requested": False,
+            }
+            self._write_job(job)
+            self._processes[job_id] = process
+
+        threading.Thread(target=self._watch, args=(job_id, process), name=f"training-job-{job_id}", daemon=True).start()
+        logger.info(f"Started training job {job_id} with pid {process.pid}")
+        return self.get(job_id)
+
+    def get(self, job_id: str) -> Optional[dict]:
+        with self._lock:
+            job = self._read_job(job_id)
+            if job is None:
+                return None
+            job = self._reconcile(job)
+        stages = self._stage_progress(job_id, finished=job["status"] != self.RUNNING)
+        completed = sum(stage["status"] == "completed" for stage in stages)
+        finished_at = job["finished_at"] or time.time()
+        return {
+            **job,
+            "elapsed_s": round(finished_at - job["created_at"], 1),
+            "stages": stages,
+            "progress": round(completed / len(stages), 4) if stages else 0.0,
+        }
+
+    def list_jobs(self) -> List[dict]:
+        jobs = [self.get(path.name) for path in self.root_dir.iterdir() if path.is_dir()]
+        return sorted((job for job in jobs if job), key=lambda job: job["created_at"], reverse=True)
+
+    def logs(self, job_id: str, tail: int = 200) -> Optional[List[str]]:
+        try:
+            with open(self._log_path(job_id), "r", encoding="utf-8", errors="replace") as f:
+                return [line.rstrip("\n") for line in deque(f, maxlen=max(1, tail))]
+        except OSError:
+            return None
+
+    def cancel(self, job_id: str) -> Optional[dict]:
+        with self._lock:
+            job = self._read_job(job_id)
+            if job is None or job["status"] != self.RUNNING:
+                return self.get(job_id) if job else None
+            job["cancel_requested"] = True
+            self._write_job(job)
+
+        if self._is_alive(job):
+            try:
+                parent = psutil.Process(job["pid"])
+                processes = parent.children(recursive=True) + [parent]
+            except psutil.Error:
+                processes = []
+            for process in processes:
+                try:
+                    process.terminate()
+                except psutil.Error:
+                    pass
+            _, alive = psutil.wait_procs(processes, timeout=10)
+            for process in alive:
+                try:
+                    process.kill()
+                except psutil.Error:
+                    pass
+            logger.info(f"Cancelled training job {job_id}")
+        return self.get(job_id)
@@ -1,13 +1,18 @@
 from TextSummarizer.constants import *
 from TextSummarizer.utils.file_utils import *
 from TextSummarizer.utils.config_utils import *
-from TextSummarizer.utils.lib_utils import *
 from TextSummarizer.entity import (DataIngestionConfig,
                                    DataValidationConfig,
                                    DataStandardizationConfig,
                                    DataTransformationConfig,
                                    TrainingConfig,
-                                   ViewersConfig)
+                                   ViewersConfig,
+                                   ServingConfig,
+                                   InferenceConfig,
+                                   QuantizationComparisonConfig,
+                                   OnnxExportConfig,
+                                   TrainingJobsConfig,
+                                   SummaryPersistenceConfig)
 
 class ConfigurationManager:
     def __init__(
@@ -58,11 +63,19 @@ class ConfigurationManager:
             input_file_directory=config.input_file_directory,
             output_dir = config.output_dir,
             output_file = config.output_file,
+            artifact_file = config.artifact_file,
+            export_csv = config.export_csv,
             ALL_REQUIRED_FILES=config.ALL_REQUIRED_FILES,
             text_columns  = config.text_columns,
             relevant_fields = config.relevant_fields,
             merging_key = config.merging_key,
-            nltk_dir = config.nltk_dir
+            nltk_dir = config.nltk_dir,
+            lemma_cache_file = config.lemma_cache_file,
+            lemma_cache_size = config.lemma_cache_size,
+            workers = config.workers,
+            chunk_size = config.chunk_size,
+            streaming = config.streaming,
+            stream_chunk_rows = config.stream_chunk_rows
             #output_file_path=os.path.join(config.output_dir, config.output_file)
    
         )
@@ -108,6 +121,7 @@ class ConfigurationManager:
             save_total_limit = config.save_total_limit,
             num_train_epochs = config.num_train_epochs,
             push_to_hub = config.push_to_hub,
+            versions_dir = os.path.join(config.output_dir, "versions"),
             device = config.device,
             prefix = config.prefix
         )
@@ -125,4 +139,124 @@ class ConfigurationManager:
         port = config.port
         )
 
-        return viwers_config
\ No newline at end of file
+        return viwers_config
+    
+    def get_serving_config(self) -> ServingConfig:
+        config = self.config.serving
+
+        serving_config = ServingConfig(
+            host = config.host,
+            port = config.port,
+            workers = config.workers,
+            threads_per_worker = config.threads_per_worker,
+            pin_cpus = config.pin_cpus
+        )
+
+        return serving_config
+    
+    def get_inference_config(self) -> InferenceConfig:
+        model_config = self.params.model
+        config = self.params.inference
+
+        inference_config = InferenceConfig(
+            model_path = os.path.join(model_config.output_dir, config.model_name),
+            tokenizer_path = os.path.join(model_config.output_dir, config.tokenizer_name),
+            warmup_text = config.warmup_text,
+            generation_profiles = self.params.generation_profiles.to_dict(),
+            default_profile = config.default_profile,
+            stream_profile = config.stream_profile,
+            backend = config.backend,
+            max_batch_size = config.max_batch_size,
+            max_wait_ms = config.max_wait_ms,
+            max_queue_size = config.max_queue_size,
+            long_request_tokens = config.long_request_tokens,
+            short_lane_workers = config.short_lane_workers,
+            long_lane_workers = config.long_lane_workers,
+            queue_aging_per_s = config.queue_aging_per_s,
+            max_request_cost = config.max_request_cost,
+            cache_enabled = config.cache_enabled,
+            cache_dir = config.cache_dir,
+            cache_max_entries = config.cache_max_entries,
+            chunk_size = config.chunk_size,
+            chunk_overlap = config.chunk_overlap,
+            max_reduce_depth = config.max_reduce_depth,
+            idf_cache_path = config.idf_cache_path,
+            idf_corpus_path = os.path.join(self.config.data_standardization.output_dir, self.config.data_standardization.artifact_file),
+            idf_corpus_column = config.idf_corpus_column,
+            prefilter_max_sentences = config.prefilter_max_sentences,
+            executor_type = config.executor_type,
+            executor_workers = config.executor_workers,
+            executor_queue_size = config.executor_queue_size,
+            versions_dir = os.path.join(model_config.output_dir, "versions"),
+            model_watch_interval_s = config.model_watch_interval_s,
+            swap_drain_timeout_s = config.swap_drain_timeout_s
+        )
+
+        return inference_config
+    
+    def get_quantization_comparison_config(self) -> QuantizationComparisonConfig:
+        config = self.config.quantization_comparison
+        inference_config = self.get_inference_config()
+
+        create_directories([config.root_dir])
+
+        quantization_comparison_config = QuantizationComparisonConfig(
+            root_dir = config.root_dir,
+            model_path = inference_config.model_path,
+            tokenizer_path = inference_config.tokenizer_path,
+            test_data_path = config.test_data_path,
+            report_file = config.report_file,
+            sample_size = config.sample_size,
+            gen_kwargs = inference_config.generation_profiles[config.profile]
+        )
+
+        return quantization_comparison_config
+    
+    def get_onnx_export_config(self) -> OnnxExportConfig:
+        config = self.config.onnx_export
+        inference_config = self.get_inference_config()
+
+        create_directories([config.root_dir])
+
+        onnx_export_config = OnnxExportConfig(
+            root_dir = config.root_dir,
+            model_path = inference_config.model_path,
+            tokenizer_path = inference_config.tokenizer_path,
+            test_data_path = config.test_data_path,
+            report_file = config.report_file,
+            parity_sample_size = config.parity_sample_size,
+            gen_kwargs = inference_config.generation_profiles[config.profile]
+        )
+
+        return onnx_export_config
+    
+    def get_training_jobs_config(self) -> TrainingJobsConfig:
+        config = self.config.training_jobs
+
+        create_directories([config.root_dir])
+
+        training_jobs_config = TrainingJobsConfig(
+            root_dir = config.root_dir,
+            entry_point = config.entry_point,
+            max_concurrent_jobs = config.max_concurrent_jobs,
+            torch_threads = config.torch_threads,
+            niceness = config.niceness
+        )
+
+        return training_jobs_config
+
+    
+    def get_summary_persistence_config(self) -> SummaryPersistenceConfig:
+        config = self.config.summary_persistence
+
+        summary_persistence_config = SummaryPersistenceConfig(
+            enabled = config.enabled,
+            batch_size = config.batch_size,
+            flush_interval_s = config.flush_interval_s,
+            max_buffer_size = config.max_buffer_size,
+            max_retries = config.max_retries,
+            retry_backoff_s = config.retry_backoff_s,
+            close_timeout_s = config.close_timeout_s
+        )
+
+        return summary_persistence_config
@@ -1,7 +1,6 @@
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List
-import torch
+from typing import List, Optional
 
 @dataclass(frozen=True)
 class DataIngestionConfig:
@@ -26,11 +25,19 @@ class DataStandardizationConfig:
     input_file_directory: Path
     output_dir: Path
     output_file: Path
+    artifact_file: Path
+    export_csv: bool
     ALL_REQUIRED_FILES: list
     text_columns: list
     relevant_fields: list
     merging_key: str
     nltk_dir: Path
+    lemma_cache_file: Path
+    lemma_cache_size: int
+    workers: int
+    chunk_size: int
+    streaming: bool
+    stream_chunk_rows: int
     
     
     
@@ -62,10 +69,99 @@ class TrainingConfig:
     num_train_epochs: int
     prefix: str
     push_to_hub: bool
-    device: str = "cuda" if torch.cuda.is_available() else "cpu"
+    versions_dir: Path
+    device: Optional[str] = None
     
 @dataclass(frozen=True)
 class ViewersConfig:
     root_dir: Path
     text_to_text_module: Path
-    port: int
\ No newline at end of file
+    port: int
+
+@dataclass(frozen=True)
+class ServingConfig:
+    host: str
+    port: int
+    workers: int
+    threads_per_worker: int
+    pin_cpus: bool
+
+
+@dataclass(frozen=True)
+class InferenceConfig:
+    model_path: Path
+    tokenizer_path: Path
+    warmup_text: str
+    generation_profiles: dict
+    default_profile: str
+    stream_profile: str
+    backend: str
+    max_batch_size: int
+    max_wait_ms: float
+    max_queue_size: int
+    long_request_tokens: int
+    short_lane_workers: int
+    long_lane_workers: int
+    queue_aging_per_s: float
+    max_request_cost: int
+    cache_enabled: bool
+    cache_dir: Path
+    cache_max_entries: int
+    chunk_size: int
+    chunk_overlap: int
+    max_reduce_depth: int
+    idf_cache_path: Path
+    idf_corpus_path: Path
+    idf_corpus_column: str
+    prefilter_max_sentences: int
+    executor_type: str
+    executor_workers: int
+    executor_queue_size: int
+    versions_dir: Path
+    model_watch_interval_s: float
+    swap_drain_timeout_s: float
+
+
+
+@dataclass(frozen=True)
+class QuantizationComparisonConfig:
+    root_dir: Path
+    model_path: Path
+    tokenizer_path: Path
+    test_data_path: Path
+    report_file: Path
+    sample_size: int
+    gen_kwargs: dict
+
+
+
+@dataclass(frozen=True)
+class OnnxExportConfig:
+    root_dir: Path
+    model_path: Path
+    tokenizer_path: Path
+    test_data_path: Path
+    report_file: Path
+    parity_sample_size: int
+    gen_kwargs: dict
+
+
+
+@dataclass(frozen=True)
+class TrainingJobsConfig:
+    root_dir: Path
+    entry_point: Path
+    max_concurrent_jobs: int
+    torch_threads: int
+    niceness: int
+
+
+@dataclass(frozen=True)
+class SummaryPersistenceConfig:
+    enabled: bool
+    batch_size: int
+    flush_interval_s: float
+    max_buffer_size: int
+    max_retries: int
+    retry_backoff_s: float
+    close_timeout_s: float
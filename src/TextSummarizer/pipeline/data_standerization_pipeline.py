@@ -10,6 +10,9 @@ class DataStanderizationPipeline:
         config = ConfigurationManager()
         standardization_config = config.get_data_standardization_config()
         standardizer = DataStandardization(config=standardization_config, remove_stops=True,  lemmatize=True)
+        if standardization_config.streaming:
+            standardizer.standardize_in_chunks()
+            return
         df = standardizer.load_and_prepare_data()
         processed_df = standardizer.process_dataframe(df)
         standardizer.save_data(processed_df)
\ No newline at end of file
@@ -1,27 +1,431 @@
+import math
+import threading
+import time
+import weakref
+from contextlib import closing
+from concurrent.futures import Future
+from typing import Dict, Iterator, List, Optional, Tuple
 from TextSummarizer.config.configuration import ConfigurationManager
-from transformers import AutoTokenizer
-from transformers import pipeline
-import os
+from TextSummarizer.components.model_registry import LoadedSummarizer, ModelRegistry
+from TextSummarizer.components.model_versions import (UNVERSIONED, ModelVersion, current_version,
+                                                      list_versions, resolve_model_version, set_current_version)
+from TextSummarizer.components.micro_batcher import CostLimitExceededError, MicroBatcher, TimedFuture
+from TextSummarizer.components.summary_cache import SummaryCache
+from TextSummarizer.components.extractive_prefilter import ExtractivePrefilter
+from TextSummarizer.components.inference_metrics import TIME_TO_FIRST_TOKEN
+from TextSummarizer.logging import logger
+
 
 class PredictionPipeline:
+    # Profile keys that configure the pipeline rather than ``generate``
+    EXTRACTIVE_BUDGET_KEY = "extractive_budget"
+
     def __init__(self):
-        self.config = ConfigurationManager().get_model_summarizer_config()
-        self.tokenizer_name = "FTModel_Tokenzer"
-        self.model_name = "FTsummarizer_model"
+        self.config = ConfigurationManager().get_inference_config()
+        self.profiles = self.config.generation_profiles
+        self._stream_stats = {"streams": 0, "ttft_ms_total": 0.0, "ttft_ms_max": 0.0, "ttft_ms_last": 0.0}
+        self._stream_lock = threading.Lock()
+        self.active_version = self.resolve_version()
+        self.swap_status = {"state": "idle", "target": None, "error": None}
+        self._active_lock = threading.Lock()
+        self._swap_lock = threading.Lock()
+        self._pinned: "weakref.WeakValueDictionary[str, LoadedSummarizer]" = weakref.WeakValueDictionary()
+        self._watcher = None
+        self.batcher = MicroBatcher(
+            summarize_fn=self.summarize_batch,
+            max_batch_size=self.config.max_batch_size,
+            max_wait_ms=self.config.max_wait_ms,
+            max_queue_size=self.config.max_queue_size,
+            lane_workers={"short": self.config.short_lane_workers, "long": self.config.long_lane_workers},
+            aging_per_s=self.config.queue_aging_per_s
+        )
+        self.cache = SummaryCache(
+            cache_dir=self.config.cache_dir,
+            max_entries=self.config.cache_max_entries,
+            enabled=self.config.cache_enabled
+        )
+        self.prefilter = ExtractivePrefilter(
+            idf_cache_path=self.config.idf_cache_path,
+            corpus_path=self.config.idf_corpus_path,
+            corpus_column=self.config.idf_corpus_column,
+            max_sentences=self.config.prefilter_max_sentences
+        )
+
+    @property
+    def is_ready(self) -> bool:
+        model_version = self.active_version
+        return ModelRegistry.is_ready(model_version.model_path, model_version.tokenizer_path, self.config.backend)
+
+    @property
+    def state(self) -> str:
+        model_version = self.active_version
+        return ModelRegistry.entry(model_version.model_path, model_version.tokenizer_path, self.config.backend).state
+
+    def resolve_version(self, version: Optional[str] = None) -> ModelVersion:
+        return resolve_model_version(self.config.versions_dir, self.config.model_path, self.config.tokenizer_path, version)
+
+    def _summarizer(self, model_version: ModelVersion) -> LoadedSummarizer:
+        return ModelRegistry.get(model_version.model_path, model_version.tokenizer_path, self.config.warmup_text, self.config.backend)
+
+    def warmup(self):
+        if any(self.EXTRACTIVE_BUDGET_KEY in profile for profile in self.profiles.values()):
+            self.prefilter.ensure_loaded()
+        while True:
+            model_version = self.active_version
+            summarizer = self._summarizer(model_version)
+            if model_version == self.active_version:
+                return summarizer
+            # A swap retired this version while it was being fetched, so ``get`` may have
+            # re-created and reloaded it; drop that copy rather than leaking it in the registry
+            if ModelRegistry.discard(summarizer) and summarizer.in_flight <= 0:
+                summarizer.unload()
+
+    def _checkout(self) -> Tuple[ModelVersion, LoadedSummarizer]:
+        """Pin the active model version for one request; the caller must ``release()`` the summarizer.
+
+        The registry entry of the active version is looked up and acquired under the same lock
+        a swap takes to switch versions, so a retired version is never re-created and the old
+        model is only drained once every request pinned to it has finished. Loading happens
+        after the pin, outside the lock.
+        """
+        with self._active_lock:
+            model_version = self.active_version
+            summarizer = ModelRegistry.entry(model_version.model_path, model_version.tokenizer_path, self.config.backend)
+            summarizer.acquire()
+            self._pinned[model_version.version] = summarizer
+        try:
+            summarizer.ensure_loaded(self.config.warmup_text)
+        except Exception:
+            summarizer.release()
+            raise
+        return model_version, summarizer
+
+    def _cache_get(self, model_version: ModelVersion, summarizer: LoadedSummarizer, text: str, gen_kwargs: dict) -> Optional[str]:
+        # Only the active version touches the cache; a draining model would evict the new model's entries
+        if model_version != self.active_version:
+            return None
+        return self.cache.get(text, gen_kwargs, summarizer.fingerprint)
+
+    def _cache_put(self, model_version: ModelVersion, summarizer: LoadedSummarizer, text: str, gen_kwargs: dict, summary: str):
+        if model_version == self.active_version:
+            self.cache.put(text, gen_kwargs, summarizer.fingerprint, summary)
+
+    def resolve_profile(self, profile: Optional[str] = None, streaming: bool = False) -> Tuple[str, dict]:
+        name = profile or (self.config.stream_profile if streaming else self.config.default_profile)
+        if name not in self.profiles:
+            raise ValueError(f"Unknown generation profile '{name}'. Available profiles: {sorted(self.profiles)}")
+        gen_kwargs = dict(self.profiles[name])
+        gen_kwargs.pop(self.EXTRACTIVE_BUDGET_KEY, None)
+        if streaming and gen_kwargs.get("num_beams", 1) > 1:
+            raise ValueError(f"Generation profile '{name}' uses beam search and cannot be streamed")
+        return name, gen_kwargs
+
+    def extractive_budget(self, profile: str) -> Optional[int]:
+        return self.profiles[profile].get(self.EXTRACTIVE_BUDGET_KEY) or None
+
+    def _batch_kwargs(self, profile: str, gen_kwargs: dict) -> dict:
+        """``gen_kwargs`` plus the profile's extractive budget, for work the batcher runs.
+
+        The batcher worker applies the pre-filter, and the budget keys the cache next to the raw
+        text, so a document gets the same cache entry from every route.
+        """
+        budget = self.extractive_budget(profile)
+        return {**gen_kwargs, self.EXTRACTIVE_BUDGET_KEY: budget} if budget is not None else gen_kwargs
+
+    def _prefilter(self, summarizer: LoadedSummarizer, profile: str, texts: List[str]) -> List[str]:
+        """Shrink each text to its top-ranked sentences when ``profile`` sets an extractive budget."""
+        budget = self.extractive_budget(profile)
+        if budget is None:
+            return texts
+        return [self.prefilter.filter(text, budget, summarizer.token_lengths) for text in texts]
+
+    def input_tokens(self, summarizer: LoadedSummarizer, texts: List[str], long_document: bool = False,
+                     extractive_budget: Optional[int] = None) -> List[int]:
+        """Tokens the model will encode for each of ``texts``, counted with the fast tokenizer.
+
+        Single-pass inputs are truncated to the model context, long documents are map-reduced
+        over all of their tokens, and an extractive budget caps either.
+        """
+        if not texts:
+            return []
+        lengths = summarizer.token_lengths(texts)
+        if extractive_budget:
+            lengths = [min(length, extractive_budget) for length in lengths]
+        if long_document:
+            stride = self.config.chunk_size - self.config.chunk_overlap
+            return [length + max(0, math.ceil((length - self.config.chunk_size) / stride)) * self.config.chunk_overlap for length in lengths]
+        return [min(length, summarizer.tokenizer.model_max_length) for length in lengths]
+
+    def estimate_cost(self, summarizer: LoadedSummarizer, texts: List[str], gen_kwargs: dict,
+                      long_document: bool = False, extractive_budget: Optional[int] = None) -> Tuple[int, int]:
+        """Estimate ``(input tokens, cost)`` for ``texts`` with the fast tokenizer.
+
+        Cost is input tokens times beams: encoder work grows with the input and every beam
+        cross-attends over it while decoding.
+        """
+        input_tokens = sum(self.input_tokens(summarizer, texts, long_document, extractive_budget))
+        return input_tokens, input_tokens * max(1, int(gen_kwargs.get("num_beams", 1)))
+
+    def _check_cost(self, cost: int):
+        if cost > self.config.max_request_cost:
+            raise CostLimitExceededError(f"Estimated request cost {cost} exceeds the limit of {self.config.max_request_cost}; split the input or use a profile with fewer beams")
+
+    def admit(self, texts: List[str], profile: Optional[str] = None, long_document: bool = False) -> int:
+        """Reject work whose estimated cost is over ``max_request_cost`` before any of it is queued.
+
+        Every document is checked on its own: a batch is bounded by the inference executor and
+        its documents are scheduled one by one, so only a single oversized document is refused.
+        Returns the total cost.
+        """
+        name, gen_kwargs = self.resolve_profile(profile)
+        # Pinned like ``submit`` so a concurrent swap cannot unload the tokenizer mid-estimate
+        _, summarizer = self._checkout()
+        try:
+            lengths = self.input_tokens(summarizer, texts, long_document, self.extractive_budget(name))
+        finally:
+            summarizer.release()
+        beams = max(1, int(gen_kwargs.get("num_beams", 1)))
+        self._check_cost(max(lengths, default=0) * beams)
+        return sum(lengths) * beams
+
+    def summarize_batch(self, texts: List[str], gen_kwargs: dict, model_version: Optional[str] = None) -> List[str]:
+        summarizer = self._pinned.get(model_version) if model_version else None
+        if summarizer is None:
+            summarizer = self.warmup()
+        gen_kwargs = dict(gen_kwargs)
+        # ``_batch_kwargs`` leaves the extractive pre-filter to the batcher worker, off the request path
+        budget = gen_kwargs.pop(self.EXTRACTIVE_BUDGET_KEY, None)
+        if budget:
+            texts = [self.prefilter.filter(text, budget, summarizer.token_lengths) for text in texts]
+        return summarizer.summarize(texts, **gen_kwargs)
+
+    def submit(self, text: str, profile: Optional[str] = None) -> TimedFuture:
+        name, gen_kwargs = self.resolve_profile(profile)
+        model_version, summarizer = self._checkout()
+        try:
+            # Priced on the raw text, as ``admit`` does, so oversized requests are rejected before any ranking
+            input_tokens, cost = self.estimate_cost(summarizer, [text], gen_kwargs, extractive_budget=self.extractive_budget(name))
+            self._check_cost(cost)
+            gen_kwargs = self._batch_kwargs(name, gen_kwargs)
+            cached = self._cache_get(model_version, summarizer, text, gen_kwargs)
+            if cached is not None:
+                summarizer.release()
+                future = TimedFuture()
+                future.model_version = model_version.version
+                future.set_result(cached)
+                return future
+
+            lane = "long" if input_tokens > self.config.long_request_tokens else "short"
+            future = self.batcher.submit(text, gen_kwargs, model_version.version, cost=cost, lane=lane)
+        except Exception:
+            summarizer.release()
+            raise
+
+        def _done(done: Future):
+            summarizer.release()
+            if not done.cancelled() and done.exception() is None:
+                self._cache_put(model_version, summarizer, text, gen_kwargs, done.result())
+
+        future.add_done_callback(_done)
+        return future
+
+    def _summarize_documents(self, model_version: ModelVersion, summarizer: LoadedSummarizer, texts: List[str], gen_kwargs: dict) -> List[str]:
+        """Summarize many documents through the micro-batcher's scheduling lanes.
+
+        Uncached documents are sorted by length and submitted ``max_batch_size`` at a time, so
+        similar lengths are padded together. Each one is queued with its cost in the short or
+        long lane like an interactive request, so bulk work is ordered by cost as well.
+        """
+        summaries: List[str] = [""] * len(texts)
+
+        pending = []
+        for index, text in enumerate(texts):
+            cached = self._cache_get(model_version, summarizer, text, gen_kwargs)
+            if cached is None:
+                pending.append(index)
+            else:
+                summaries[index] = cached
+        if not pending:
+            return summaries
+
+        lengths = self.input_tokens(summarizer, [texts[index] for index in pending],
+                                    extractive_budget=gen_kwargs.get(self.EXTRACTIVE_BUDGET_KEY))
+        length_of = dict(zip(pending, lengths))
+        order = sorted(pending, key=lambda index: length_of[index])
+        batch_size = self.config.max_batch_size
+        beams = max(1, int(gen_kwargs.get("num_beams", 1)))
+
+        for start in range(0, len(order), batch_size):
+            bucket = order[start:start + batch_size]
+            logger.info(f"Summarizing bucket of {len(bucket)} documents with {length_of[bucket[0]]}-{length_of[bucket[-1]]} tokens")
+            futures = [
+                self.batcher.submit(texts[index], gen_kwargs, model_version.version, cost=length_of[index] * beams,
+                                    lane="long" if length_of[index] > self.config.long_request_tokens else "short")
+                for index in bucket
+            ]
+            for index, future in zip(bucket, futures):
+                summaries[index] = future.result()
+                self._cache_put(model_version, summarizer, texts[index], gen_kwargs, summaries[index])
+
+        return summaries
+
+    def predict_batch(self, texts: List[str], profile: Optional[str] = None) -> Dict:
+        name, gen_kwargs = self.resolve_profile(profile)
+        if not texts:
+            return {"summaries": [], "model_version": self.active_version.version}
+        model_version, summarizer = self._checkout()
+        try:
+            summaries = self._summarize_documents(model_version, summarizer, texts, self._batch_kwargs(name, gen_kwargs))
+        finally:
+            summarizer.release()
+        return {"summaries": summaries, "model_version": model_version.version}
+
+    def predict_long(self, text: str, profile: Optional[str] = None) -> Dict:
+        """Map-reduce summarization for documents longer than the model context.
+
+        The document is split into overlapping token windows that are summarized together as
+        one batched pass; the joined chunk summaries are split and summarized again until they
+        fit in a single window or ``max_reduce_depth`` rounds have run. Every round uses the
+        same model version.
+        """
+        name, gen_kwargs = self.resolve_profile(profile)
+        model_version, summarizer = self._checkout()
+        try:
+            text = self._prefilter(summarizer, name, [text])[0]
+            for depth in range(self.config.max_reduce_depth):
+                windows = summarizer.split_into_windows(text, self.config.chunk_size, self.config.chunk_overlap)
+                if len(windows) == 1:
+                    break
+                logger.info(f"Reduce round {depth + 1}: summarizing {len(windows)} chunks")
+                text = " ".join(self._summarize_documents(model_version, summarizer, windows, gen_kwargs))
+            else:
+                if len(summarizer.split_into_windows(text, self.config.chunk_size, self.config.chunk_overlap)) > 1:
+                    logger.warning(f"Summary still exceeds {self.config.chunk_size} tokens after {self.config.max_reduce_depth} rounds; the final pass truncates it")
+
+            summary = self._summarize_documents(model_version, summarizer, [text], gen_kwargs)[0]
+        finally:
+            summarizer.release()
+        return {"summary": summary, "model_version": model_version.version}
+
+    def stream(self, text: str, profile: Optional[str] = None) -> Iterator[Dict]:
+        """Yield ``token`` events while the summary is generated, then a final ``done`` event."""
+        profile, gen_kwargs = self.resolve_profile(profile, streaming=True)
+        model_version, summarizer = self._checkout()
+        try:
+            text = self._prefilter(summarizer, profile, [text])[0]
+            start = time.perf_counter()
+            ttft_ms = None
+            pieces = []
+            # Closed before the pin is released, so generation has stopped when the model can be unloaded
+            with closing(summarizer.stream(text, **gen_kwargs)) as token_stream:
+                for piece in token_stream:
+                    if ttft_ms is None:
+                        ttft_ms = (time.perf_counter() - start) * 1000
+                        self._record_ttft(ttft_ms)
+                        TIME_TO_FIRST_TOKEN.observe(ttft_ms / 1000)
+                    pieces.append(piece)
+                    yield {"event": "token", "text": piece}
+        finally:
+            summarizer.release()
+
+        latency_ms = (time.perf_counter() - start) * 1000
+        logger.info(f"Streamed summary in {latency_ms:.1f}ms (time to first token: {ttft_ms or 0:.1f}ms)")
+        yield {
+            "event": "done",
+            "summary": "".join(pieces).strip(),
+            "profile": profile,
+            "model_version": model_version.version,
+            "time_to_first_token_ms": round(ttft_ms or latency_ms, 2),
+            "latency_ms": round(latency_ms, 2),
+        }
+
+    def model_status(self) -> Dict:
+        return {
+            "active_version": self.active_version.version,
+            "current_version": current_version(self.config.versions_dir) or UNVERSIONED,
+            "versions": list_versions(self.config.versions_dir),
+            "swap": dict(self.swap_status),
+        }
+
+    def swap_model(self, version: Optional[str] = None) -> Dict:
+        """Switch traffic to ``version`` (default: the version ``CURRENT`` points at) without dropping requests.
+
+        The new model is loaded and warmed while the old one keeps serving, the active version
+        is switched atomically, and the old model is unloaded once its in-flight requests have
+        drained. An explicit ``version`` is also written to ``CURRENT`` so other workers follow.
+        """
+        if not self._swap_lock.acquire(blocking=False):
+            raise RuntimeError("A model swap is already in progress")
+        try:
+            target = self.resolve_version(version)
+            if version is not None:
+                set_current_version(self.config.versions_dir, target.version)
+            previous = self.active_version
+            if target == previous:
+                return self.model_status()
+
+            self.swap_status = {"state": "loading", "target": target.version, "error": None}
+            logger.info(f"Loading model version {target.version} to replace {previous.version}")
+            try:
+                summarizer = self._summarizer(target)
+            except Exception as e:
+                ModelRegistry.evict(target.model_path, target.tokenizer_path, self.config.backend)
+                self.swap_status = {"state": "failed", "target": target.version, "error": str(e)}
+                raise
+
+            with self._active_lock:
+                self.active_version = target
+            logger.info(f"Switched traffic from model version {previous.version} to {target.version}")
+
+            self.swap_status = {"state": "draining", "target": target.version, "error": None}
+            old = ModelRegistry.evict(previous.model_path, previous.tokenizer_path, self.config.backend)
+            if old is not None:
+                if old.wait_idle(self.config.swap_drain_timeout_s):
+                    old.unload()
+                else:
+                    # Its remaining requests still hold a reference; the memory is freed once they finish
+                    logger.warning(f"Model version {previous.version} still has {old.in_flight} requests in flight after {self.config.swap_drain_timeout_s}s")
+            # Only after the drain: other workers sharing the cache directory prune again on their own swap
+            if self.cache.enabled:
+                self.cache.prune(keep=summarizer.fingerprint)
+            self.swap_status = {"state": "idle", "target": None, "error": None}
+            return self.model_status()
+        finally:
+            self._swap_lock.release()
 
+    def start_model_watcher(self):
+        """Poll the ``CURRENT`` version pointer and swap to it when training publishes a new model."""
+        interval = self.config.model_watch_interval_s
+        if interval <= 0 or (self._watcher is not None and self._watcher.is_alive()):
+            return
 
-    
-    def predict(self,text):
-        tokenizer = AutoTokenizer.from_pretrained(os.path.join(self.config.output_dir,self.tokenizer_name))
-        gen_kwargs = {"length_penalty": 0.8, "num_beams":8, "max_length": 128}
+        def _watch():
+            while True:
+                time.sleep(interval)
+                version = current_version(self.config.versions_dir) or UNVERSIONED
+                failed = self.swap_status["state"] == "failed" and self.swap_status["target"] == version
+                if version == self.active_version.version or failed:
+                    continue
+                try:
+                    self.swap_model()
+                except Exception as e:
+                    logger.error(f"Swapping to model version {version} failed: {e}")
 
-        pipe = pipeline("summarization", model=os.path.join(self.config.output_dir,self.model_name),tokenizer=tokenizer)
+        self._watcher = threading.Thread(target=_watch, name="summarizer-model-watcher", daemon=True)
+        self._watcher.start()
+        logger.info(f"Watching {self.config.versions_dir} for new model versions every {interval}s")
 
-        print("Meta Text:")
-        print(text)
+    def _record_ttft(self, ttft_ms: float):
+        with self._stream_lock:
+            self._stream_stats["streams"] += 1
+            self._stream_stats["ttft_ms_total"] += ttft_ms
+            self._stream_stats["ttft_ms_max"] = max(self._stream_stats["ttft_ms_max"], ttft_ms)
+            self._stream_stats["ttft_ms_last"] = ttft_ms
 
-        output = pipe(text, **gen_kwargs)[0]["summary_text"]
-        print("\nModel Summary:")
-        print(output)
+    def stream_stats(self) -> Dict[str, float]:
+        with self._stream_lock:
+            stats = dict(self._stream_stats)
+        total = stats.pop("ttft_ms_total")
+        stats["ttft_ms_mean"] = round(total / stats["streams"], 2) if stats["streams"] else 0.0
+        return stats
 
-        return output
\ No newline at end of file
@@ -0,0 +1,22 @@
+from TextSummarizer.config.configuration import ConfigurationManager
+from TextSummarizer.components.onnx_export import OnnxExport
+from TextSummarizer.logging import logger
+
+
+class OnnxExportPipeline:
+    def __init__(self):
+        pass
+    def main(self):
+        config = ConfigurationManager()
+        onnx_export_config = config.get_onnx_export_config()
+        onnx_export = OnnxExport(config=onnx_export_config)
+        onnx_export.export()
+        report = onnx_export.verify_parity()
+        onnx_export.save_report(report)
+        if not report["parity"]:
+            raise ValueError(f"ONNX export does not reproduce the PyTorch summaries, see {onnx_export_config.report_file}")
+
+
+if __name__ == "__main__":
+    OnnxExportPipeline = OnnxExportPipeline()
+    OnnxExportPipeline.main()
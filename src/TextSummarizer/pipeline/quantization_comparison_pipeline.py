@@ -0,0 +1,20 @@
+from TextSummarizer.config.configuration import ConfigurationManager
+from TextSummarizer.components.quantization_comparison import QuantizationComparison
+from TextSummarizer.logging import logger
+
+
+class QuantizationComparisonPipeline:
+    def __init__(self):
+        pass
+    def main(self):
+        config = ConfigurationManager()
+        quantization_comparison_config = config.get_quantization_comparison_config()
+        quantization_comparison = QuantizationComparison(config=quantization_comparison_config)
+        report = quantization_comparison.compare()
+        quantization_comparison.save_report(report)
+        logger.info(f"Quantization comparison: {report}")
+
+
+if __name__ == "__main__":
+    QuantizationComparisonPipeline = QuantizationComparisonPipeline()
+    QuantizationComparisonPipeline.main()
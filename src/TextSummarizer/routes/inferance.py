@@ -2,10 +2,28 @@ from fastapi import FastAPI, APIRouter, Depends, HTTPException
 import uvicorn
 import sys
 import os
+import threading
+import asyncio
+import json
+import time
+from contextlib import closing
+from functools import lru_cache
+from typing import List, Optional
+from pydantic import BaseModel
 from fastapi.templating import Jinja2Templates
+from starlette.concurrency import run_in_threadpool
+from starlette.background import BackgroundTask
 from starlette.responses import RedirectResponse
-from fastapi.responses import Response
+from fastapi.responses import JSONResponse, StreamingResponse
 from TextSummarizer.pipeline.inferance_pipeline import PredictionPipeline
+from TextSummarizer.components.model_registry import LoadedSummarizer, ModelRegistry
+from TextSummarizer.components.micro_batcher import CostLimitExceededError, QueueFullError, TimedFuture
+from TextSummarizer.components.inference_executor import InferenceExecutor
+from TextSummarizer.components.training_jobs import JobLimitError, TrainingJobManager
+from TextSummarizer.config.configuration import ConfigurationManager
+from TextSummarizer.routes.base import base_router
+from TextSummarizer.routes.metrics import metrics_router, metrics_middleware
+from TextSummarizer.logging import logger
 
 
 text:str = "What is Text Summarization?"
@@ -17,38 +35,320 @@ summarizer_router = APIRouter(
     tags=["api_v1", "summarizer"],
 )
 
+
+class BatchPredictRequest(BaseModel):
+    documents: List[str]
+    profile: Optional[str] = None
+
+
+@lru_cache
+def get_prediction_pipeline() -> PredictionPipeline:
+    return PredictionPipeline()
+
+
+@lru_cache
+def get_inference_executor() -> InferenceExecutor:
+    prediction_pipeline = get_prediction_pipeline()
+    return InferenceExecutor(
+        target=prediction_pipeline,
+        executor_type=prediction_pipeline.config.executor_type,
+        max_workers=prediction_pipeline.config.executor_workers,
+        max_queue_size=prediction_pipeline.config.executor_queue_size
+    )
+
+
+@lru_cache
+def get_training_job_manager() -> TrainingJobManager:
+    return TrainingJobManager(ConfigurationManager().get_training_jobs_config())
+
+
+@lru_cache
+def get_summary_store():
+    """The MongoDB handler summaries are persisted to, or ``None`` when persistence is disabled."""
+    config = ConfigurationManager().get_summary_persistence_config()
+    if not config.enabled:
+        return None
+    from TextSummarizer.utils.config_utils import get_settings
+    from TextSummarizer.utils.data_utils import MongoDBHandler
+
+    settings = get_settings()
+    return MongoDBHandler(
+        uri=settings.MONGODB_CONNECTION_STRING,
+        db_name=settings.MONGODB_NAME,
+        write_behind=True,
+        close_timeout_s=config.close_timeout_s,
+        batch_size=config.batch_size,
+        flush_interval_s=config.flush_interval_s,
+        max_buffer_size=config.max_buffer_size,
+        max_retries=config.max_retries,
+        retry_backoff_s=config.retry_backoff_s
+    )
+
+
+def persist_summaries(texts: List[str], summaries: List[str], model_version: Optional[str], profile: str):
+    try:
+        summary_store = get_summary_store()
+        if summary_store is None:
+            return
+        for text, summary in zip(texts, summaries):
+            summary_store.save_summary(text, summary, model_version, profile=profile)
+    except Exception as e:
+        logger.error(f"Could not persist summaries: {e}")
+
+
+def close_summary_store():
+    if get_summary_store.cache_info().currsize and get_summary_store() is not None:
+        get_summary_store().close()
+
+
+def shutdown_inference_executor():
+    if get_inference_executor.cache_info().currsize:
+        get_inference_executor().shutdown()
+
+
+def resolve_profile(prediction_pipeline: PredictionPipeline, profile: Optional[str], streaming: bool = False) -> str:
+    try:
+        name, _ = prediction_pipeline.resolve_profile(profile, streaming=streaming)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return name
+
+
+async def await_timed(future: TimedFuture, started: float) -> dict:
+    result = await asyncio.wrap_future(future)
+    return {
+        "result": result,
+        "latency_ms": round((time.perf_counter() - started) * 1000, 2),
+        "queue_wait_ms": round(future.queue_wait_ms, 2),
+        "compute_ms": round(future.compute_ms, 2),
+    }
+
+
+def warmup_in_background():
+    def _warmup():
+        try:
+            get_prediction_pipeline().warmup()
+        except Exception as e:
+            logger.exception(f"Model warmup failed: {e}")
+
+    threading.Thread(target=_warmup, name="summarizer-warmup", daemon=True).start()
+
+
+def ensure_ready(prediction_pipeline: PredictionPipeline):
+    if prediction_pipeline.is_ready:
+        return
+    if prediction_pipeline.state != LoadedSummarizer.LOADING:
+        warmup_in_background()
+    raise HTTPException(status_code=503, detail="Model is warming up", headers={"Retry-After": "5"})
+
+
 @summarizer_router.get("/", tags=["authentication"])
 async def index():
     return RedirectResponse(url="/docs")
 
 
+@summarizer_router.get("/ready")
+async def readiness(prediction_pipeline: PredictionPipeline = Depends(get_prediction_pipeline)):
+    content = {"state": prediction_pipeline.state, "models": ModelRegistry.status()}
+    status_code = 200 if prediction_pipeline.is_ready else 503
+    return JSONResponse(content=content, status_code=status_code)
+
+
+@summarizer_router.get("/profiles")
+async def generation_profiles(prediction_pipeline: PredictionPipeline = Depends(get_prediction_pipeline)):
+    return {
+        "default": prediction_pipeline.config.default_profile,
+        "stream_default": prediction_pipeline.config.stream_profile,
+        "profiles": prediction_pipeline.profiles,
+    }
+
+
+@summarizer_router.get("/models")
+async def model_versions(prediction_pipeline: PredictionPipeline = Depends(get_prediction_pipeline)):
+    return prediction_pipeline.model_status()
 
-@summarizer_router.get("/train")
-async def training():
+
+@summarizer_router.post("/models/swap", status_code=202)
+async def swap_model(version: Optional[str] = None, prediction_pipeline: PredictionPipeline = Depends(get_prediction_pipeline)):
     try:
-        os.system("python main.py")
-        return Response("Training successful !!")
+        prediction_pipeline.resolve_version(version)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if prediction_pipeline.swap_status["state"] in ("loading", "draining"):
+        raise HTTPException(status_code=409, detail="A model swap is already in progress")
+
+    def _swap():
+        try:
+            prediction_pipeline.swap_model(version)
+        except Exception as e:
+            logger.error(f"Model swap failed: {e}")
+
+    threading.Thread(target=_swap, name="summarizer-model-swap", daemon=True).start()
+    return prediction_pipeline.model_status()
+
+
+@summarizer_router.get("/cache")
+async def cache_stats(prediction_pipeline: PredictionPipeline = Depends(get_prediction_pipeline)):
+    return prediction_pipeline.cache.stats()
+
+
+@summarizer_router.get("/persistence")
+async def persistence_stats():
+    summary_store = get_summary_store()
+    if summary_store is None:
+        return {"enabled": False}
+    return {"enabled": True, **summary_store.summary_writer.stats()}
+
+
+@summarizer_router.post("/train", status_code=202)
+def training(job_manager: TrainingJobManager = Depends(get_training_job_manager)):
+    try:
+        return job_manager.start()
+    except JobLimitError as e:
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": "60"})
+
+
+@summarizer_router.get("/train/jobs")
+def training_jobs(job_manager: TrainingJobManager = Depends(get_training_job_manager)):
+    return job_manager.list_jobs()
+
+
+@summarizer_router.get("/train/jobs/{job_id}")
+def training_job_status(job_id: str, job_manager: TrainingJobManager = Depends(get_training_job_manager)):
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown training job: {job_id}")
+    return job
+
+
+@summarizer_router.get("/train/jobs/{job_id}/logs")
+def training_job_logs(job_id: str, tail: int = 200, job_manager: TrainingJobManager = Depends(get_training_job_manager)):
+    lines = job_manager.logs(job_id, tail)
+    if lines is None:
+        raise HTTPException(status_code=404, detail=f"Unknown training job: {job_id}")
+    return {"job_id": job_id, "lines": lines}
 
-    except Exception as e:
-        return Response(f"Error Occurred! {e}")
-    
 
+@summarizer_router.post("/train/jobs/{job_id}/cancel")
+def cancel_training_job(job_id: str, job_manager: TrainingJobManager = Depends(get_training_job_manager)):
+    job = job_manager.cancel(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown training job: {job_id}")
+    return job
 
 
 @summarizer_router.post("/predict")
-async def predict_route(text: str):  
+async def predict_route(text: str, profile: Optional[str] = None, long_document: bool = False, prediction_pipeline: PredictionPipeline = Depends(get_prediction_pipeline)):
+    ensure_ready(prediction_pipeline)
+    profile = resolve_profile(prediction_pipeline, profile)
+    started = time.perf_counter()
     try:
-        obj = PredictionPipeline()
-        result = obj.predict(text)
-        return {"summary": result}  
+        if long_document:
+            await run_in_threadpool(prediction_pipeline.admit, [text], profile, long_document=True)
+            future = get_inference_executor().submit("predict_long", text, profile)
+        else:
+            # Tokenization, cache reads and model checkout block, so they stay off the event loop
+            future = await run_in_threadpool(prediction_pipeline.submit, text, profile)
+        timed = await await_timed(future, started)
+        result = timed.pop("result")
+        if long_document:
+            persist_summaries([text], [result["summary"]], result["model_version"], profile)
+            return {**result, "profile": profile, **timed}
+        persist_summaries([text], [result], future.model_version, profile)
+        return {"summary": result, "model_version": future.model_version, "profile": profile, **timed}
+    except CostLimitExceededError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except QueueFullError as e:
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": "1"})
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+
+@summarizer_router.post("/predict/batch")
+async def predict_batch_route(request: BatchPredictRequest, prediction_pipeline: PredictionPipeline = Depends(get_prediction_pipeline)):
+    ensure_ready(prediction_pipeline)
+    profile = resolve_profile(prediction_pipeline, request.profile)
+    started = time.perf_counter()
+    try:
+        await run_in_threadpool(prediction_pipeline.admit, request.documents, profile)
+        future = get_inference_executor().submit("predict_batch", request.documents, profile)
+        timed = await await_timed(future, started)
+        result = timed.pop("result")
+        persist_summaries(request.documents, result["summaries"], result["model_version"], profile)
+        return {**result, "profile": profile, **timed}
+    except CostLimitExceededError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except QueueFullError as e:
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": "1"})
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@summarizer_router.get("/predict/stream")
+async def predict_stream_route(text: str, profile: Optional[str] = None, prediction_pipeline: PredictionPipeline = Depends(get_prediction_pipeline)):
+    ensure_ready(prediction_pipeline)
+    profile = resolve_profile(prediction_pipeline, profile, streaming=True)
+    try:
+        await run_in_threadpool(prediction_pipeline.admit, [text], profile)
+    except CostLimitExceededError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    # A stream generates on the server's thread pool, so it holds an executor slot for its whole duration
+    executor = get_inference_executor()
+    try:
+        executor.reserve()
+    except QueueFullError as e:
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": "1"})
+    released = threading.Lock()
+
+    def release_slot():
+        if released.acquire(blocking=False):
+            executor.release()
+
+    def events():
+        try:
+            with closing(prediction_pipeline.stream(text, profile)) as summary_stream:
+                for event in summary_stream:
+                    name = event.pop("event")
+                    yield f"event: {name}\ndata: {json.dumps(event)}\n\n"
+        except Exception as e:
+            logger.error(f"Streaming summarization failed: {e}")
+            yield f"event: error\ndata: {json.dumps({'detail': str(e)})}\n\n"
+        finally:
+            release_slot()
+
+    stream_events = events()
+
+    def finish_stream():
+        # After a disconnect the generator is left suspended; closing it cancels generation and
+        # joins the generate thread before the slot is released. A stream that never started
+        # has no thread and is released directly.
+        try:
+            stream_events.close()
+        except ValueError:
+            # Still running on a pool thread; the generator's own ``finally`` releases the slot
+            return
+        release_slot()
+
+    return StreamingResponse(stream_events, media_type="text/event-stream", headers={"Cache-Control": "no-cache"},
+                             background=BackgroundTask(finish_stream))
+
+
+@summarizer_router.get("/predict/stream/stats")
+async def stream_stats(prediction_pipeline: PredictionPipeline = Depends(get_prediction_pipeline)):
+    return prediction_pipeline.stream_stats()
+
 def create_app():
     app = FastAPI()
+    app.middleware("http")(metrics_middleware)
+    app.include_router(metrics_router)
+    app.include_router(base_router)
     app.include_router(summarizer_router)
+    app.add_event_handler("startup", warmup_in_background)
+    app.add_event_handler("startup", lambda: get_prediction_pipeline().start_model_watcher())
+    app.add_event_handler("shutdown", shutdown_inference_executor)
+    app.add_event_handler("shutdown", close_summary_store)
     return app
-    
+
 if __name__ == "__main__":
     app = create_app()
-    uvicorn.run(app, host="127.0.0.1", port=8000)
\ No newline at end of file
+    uvicorn.run(app, host="127.0.0.1", port=8000)
@@ -0,0 +1,45 @@
+import os
+import time
+from fastapi import APIRouter, Request
+from fastapi.responses import Response
+from prometheus_client import CONTENT_TYPE_LATEST, CollectorRegistry, generate_latest, multiprocess
+from TextSummarizer.components.inference_metrics import REQUESTS, REQUEST_ERRORS, REQUEST_LATENCY
+
+metrics_router = APIRouter(
+    tags=["metrics"],
+)
+
+@metrics_router.get("/metrics")
+async def metrics():
+    if "PROMETHEUS_MULTIPROC_DIR" not in os.environ:
+        return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
+    # Several API workers: aggregate the samples every worker wrote to the shared directory
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return Response(content=generate_latest(registry), media_type=CONTENT_TYPE_LATEST)
+
+
+async def metrics_middleware(request: Request, call_next):
+    start = time.perf_counter()
+    method = request.method
+    try:
+        response = await call_next(request)
+    except Exception:
+        route = _route_path(request)
+        REQUEST_ERRORS.labels(route, method).inc()
+        REQUESTS.labels(route, method, "500").inc()
+        REQUEST_LATENCY.labels(route, method).observe(time.perf_counter() - start)
+        raise
+
+    route = _route_path(request)
+    REQUESTS.labels(route, method, str(response.status_code)).inc()
+    if response.status_code >= 500:
+        REQUEST_ERRORS.labels(route, method).inc()
+    REQUEST_LATENCY.labels(route, method).observe(time.perf_counter() - start)
+    return response
+
+
+def _route_path(request: Request) -> str:
+    # Use the route template so path parameters do not create new label values
+    route = request.scope.get("route")
+    return getattr(route, "path", "unmatched")
@@ -1,29 +1,28 @@
 from pymongo import MongoClient
 from typing import Dict, List, Optional
-import pandas as pd
-from datetime import datetime
+from TextSummarizer.components.dataset_upload import DatasetUploader
+from TextSummarizer.components.summary_writer import WriteBehindBuffer, summary_document
 
 class MongoDBHandler:
-   def __init__(self, uri: str, db_name: str):
+   def __init__(self, uri: str, db_name: str, write_behind: bool = False, close_timeout_s: float = 30, **write_behind_options):
        self.client = MongoClient(uri)
        self.db = self.client[db_name]
        self.texts = self.db['texts']
        self.summaries = self.db['summaries']
-
-   def upload_dataset(self, dataset, batch_size: int = 1000):
-       df = dataset.to_pandas() if not isinstance(dataset, pd.DataFrame) else dataset
-       records = df.to_dict('records')
-       
-       for i in range(0, len(records), batch_size):
-           self.texts.insert_many(records[i:i + batch_size])
-
-   def save_summary(self, text: str, summary: str, model_name: str) -> str:
-       doc = {
-           "text": text,
-           "summary": summary,
-           "model": model_name,
-           "created_at": datetime.now()
-       }
+       # With write-behind, save_summary only buffers and a background thread batches the inserts
+       self.summary_writer = WriteBehindBuffer(self.summaries, **write_behind_options) if write_behind else None
+       self.close_timeout_s = close_timeout_s
+
+   def upload_dataset(self, dataset, batch_size: int = 1000, concurrency: int = 4,
+                      checkpoint_path: Optional[str] = None, source_id: Optional[str] = None) -> Dict:
+       # Streams batches with concurrent unordered inserts; a checkpointed upload resumes where it stopped
+       uploader = DatasetUploader(self.texts, batch_size=batch_size, concurrency=concurrency, checkpoint_path=checkpoint_path)
+       return uploader.upload(dataset, source_id=source_id)
+
+   def save_summary(self, text: str, summary: str, model_name: str, **metadata) -> Optional[str]:
+       doc = summary_document(text, summary, model_name, **metadata)
+       if self.summary_writer is not None:
+           return self.summary_writer.put(doc)
        result = self.summaries.insert_one(doc)
        return str(result.inserted_id)
 
@@ -34,6 +33,8 @@ class MongoDBHandler:
        return list(self.summaries.find({"model": model_name}))
 
    def close(self):
+       if self.summary_writer is not None:
+           self.summary_writer.close(self.close_timeout_s)
        self.client.close()
 
    def __enter__(self):
@@ -4,14 +4,30 @@ import gradio as gr
 def create_gradio_interface():
 
     prediction_pipeline = PredictionPipeline()
+    # Load and warm the shared model before the interface starts accepting traffic
+    prediction_pipeline.warmup()
 
-    def summarize(text: str):
+    stream_profiles = [
+        name for name, gen_kwargs in prediction_pipeline.profiles.items()
+        if gen_kwargs.get("num_beams", 1) <= 1
+    ]
+
+    def summarize(text: str, profile: str):
+        summary = ""
         try:
-            result = prediction_pipeline.predict(text)
-            return result
+            # Stream partial summaries as tokens are generated
+            for event in prediction_pipeline.stream(text, profile):
+                if event["event"] == "token":
+                    summary += event["text"]
+                    yield summary
         except Exception as e:
             print(f"Error in summarization: {str(e)}")
-            return "Error occurred during summarization"
+            yield "Error occurred during summarization"
 
     # Create and return the Gradio interface
-    return gr.Interface(fn=summarize, inputs="text", outputs="text", title="Summarization Model")
+    return gr.Interface(
+        fn=summarize,
+        inputs=["text", gr.Dropdown(choices=stream_profiles, value=prediction_pipeline.config.stream_profile, label="Profile")],
+        outputs="text",
+        title="Summarization Model"
+    )
@@ -8,14 +8,18 @@ def load(e: me.LoadEvent):
 class TextSummarizerUI:
     def __init__(self):
         self.prediction_pipeline = PredictionPipeline()
+        # Load and warm the shared model before the page is registered
+        self.prediction_pipeline.warmup()
         
     def summarise(self, text: str):
         try:
-            result = self.prediction_pipeline.predict(text)
-            return result
+            # Yield tokens as they are generated so the output renders progressively
+            for event in self.prediction_pipeline.stream(text):
+                if event["event"] == "token":
+                    yield event["text"]
         except Exception as e:
             print(f"Error in summarization: {str(e)}")
-            return {"summary": "Error occurred during summarization"}
+            yield "Error occurred during summarization"
 
     def create_page(self):
         # Define the page outside of __init__